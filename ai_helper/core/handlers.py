@@ -4,6 +4,7 @@ import bpy
 from bpy.app.handlers import persistent
 
 from ..ops import ops_3d
+from ..sketch import history, store
 
 _PENDING_REBUILD = False
 _LAST_REBUILD = 0.0
@@ -55,17 +56,50 @@ def _run_rebuild(scene):
 
 @persistent
 def ai_helper_depsgraph_handler(scene, depsgraph):
+    # Track op objects added outside our operators (duplicate, append) in the cached index.
+    ops_3d.index_op_updates(scene, depsgraph)
     if not getattr(scene.ai_helper, "auto_rebuild", False):
         return
     if _should_rebuild(scene, depsgraph):
         _schedule_rebuild(scene)
 
 
+@persistent
+def ai_helper_reset_op_index(*_args):
+    ops_3d.invalidate_op_index()
+
+
+@persistent
+def ai_helper_prune_sketch_caches(*_args):
+    # Parse caches are keyed by object pointer; forget objects that no longer exist.
+    live = {obj.as_pointer() for obj in bpy.data.objects}
+    history.prune_cache(live)
+    store.prune_cache(live)
+
+
+_RESET_HANDLERS = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
+
+
 def register():
     if ai_helper_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(ai_helper_depsgraph_handler)
+    for handlers in _RESET_HANDLERS:
+        if ai_helper_reset_op_index not in handlers:
+            handlers.append(ai_helper_reset_op_index)
+        if ai_helper_prune_sketch_caches not in handlers:
+            handlers.append(ai_helper_prune_sketch_caches)
 
 
 def unregister():
     if ai_helper_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(ai_helper_depsgraph_handler)
+    for handlers in _RESET_HANDLERS:
+        if ai_helper_reset_op_index in handlers:
+            handlers.remove(ai_helper_reset_op_index)
+        if ai_helper_prune_sketch_caches in handlers:
+            handlers.remove(ai_helper_prune_sketch_caches)
+    ops_3d.invalidate_op_index()
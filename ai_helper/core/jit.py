@@ -0,0 +1,13 @@
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    # An installed but broken numba (e.g. built against another numpy) raises plain ImportError.
+    njit = None
+
+HAVE_JIT = njit is not None
+
+
+def jit(func):
+    if njit is None:
+        return func
+    return njit(cache=True)(func)
@@ -0,0 +1,23 @@
+import json
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(payload, indent: bool = False, default=None) -> str:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(payload, default=default, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(payload, default=default, indent=2)
+    return json.dumps(payload, default=default, separators=(",", ":"))
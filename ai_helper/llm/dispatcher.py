@@ -12,6 +12,7 @@ except ModuleNotFoundError:
     _IN_BLENDER = False
 
 if _IN_BLENDER:
+    from ..ops.constraints import ensure_registered
     from ..ops.sketch import (
         add_arc_to_sketch,
         add_circle_to_sketch,
@@ -669,6 +670,7 @@ def _add_constraint(_context, args: Dict[str, Any], preview: bool, messages: Lis
     if preview:
         return
 
+    ensure_registered()
     if kind == "distance":
         bpy.ops.aihelper.add_distance_constraint(distance=float(args.get("distance", 0.0)))
     elif kind == "angle":
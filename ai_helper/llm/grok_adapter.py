@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import concurrent.futures
 import importlib
 import json
 import mimetypes
@@ -10,6 +11,8 @@ import re
 import shlex
 import subprocess
 import sys
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
@@ -33,6 +36,18 @@ class GrokAdapter:
         self.vision_model = vision_model
         self._client = None
         self._client_model = None
+        _ADAPTERS.add(self)
+
+    async def aclose(self) -> None:
+        client, self._client, self._client_model = self._client, None, None
+        if client is None:
+            return
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if close is None:
+            return
+        result = close()
+        if asyncio.iscoroutine(result):
+            await result
 
     def _resolve_root(self) -> Optional[Path]:
         if not self.adapter_path:
@@ -78,6 +93,30 @@ class GrokAdapter:
         image_notes: Optional[str] = None,
         upload_command: Optional[str] = None,
         upload_timeout: Optional[int] = None,
+    ) -> List[ToolCall]:
+        return _run_async(
+            self.arequest_tool_calls(
+                prompt,
+                selection,
+                tools=tools,
+                use_mock=use_mock,
+                image_path=image_path,
+                image_notes=image_notes,
+                upload_command=upload_command,
+                upload_timeout=upload_timeout,
+            )
+        )
+
+    async def arequest_tool_calls(
+        self,
+        prompt: str,
+        selection: Dict[str, Any],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        use_mock: Optional[bool] = None,
+        image_path: Optional[str] = None,
+        image_notes: Optional[str] = None,
+        upload_command: Optional[str] = None,
+        upload_timeout: Optional[int] = None,
     ) -> List[ToolCall]:
         if use_mock is None:
             use_mock = self.mock
@@ -149,15 +188,15 @@ class GrokAdapter:
 
         if use_vision:
             try:
-                response_text = _run_async(self._client.generate_with_vision(messages=messages, images=[image_ref]))
+                response_text = await self._client.generate_with_vision(messages=messages, images=[image_ref])
             except Exception as exc:
                 if used_data_url and upload_command and _should_retry_with_upload(exc):
                     image_ref = _run_upload_command(upload_command, image_path, upload_timeout)
-                    response_text = _run_async(self._client.generate_with_vision(messages=messages, images=[image_ref]))
+                    response_text = await self._client.generate_with_vision(messages=messages, images=[image_ref])
                 else:
                     raise
         else:
-            response_text = _run_async(self._client.generate(messages=messages))
+            response_text = await self._client.generate(messages=messages)
         data = json.loads(response_text)
         return _parse_tool_calls(data)
 
@@ -344,6 +383,28 @@ def _run_upload_command(command: str, image_path: str, timeout: Optional[int]) -
     return match.group(0)
 
 
+# One loop for every request so the client's HTTP session and connections outlive a single call.
+# It runs on its own thread; callers on the main thread or a worker submit coroutines to it.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_THREAD: Optional[threading.Thread] = None
+_LOOP_LOCK = threading.Lock()
+_ADAPTERS: "weakref.WeakSet[GrokAdapter]" = weakref.WeakSet()
+# Futures callers are waiting on, so shutdown() can release them.
+_PENDING: "set[concurrent.futures.Future]" = set()
+_REQUEST_TIMEOUT = 300.0
+_SHUTDOWN_TIMEOUT = 5.0
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP, _LOOP_THREAD
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            _LOOP = asyncio.new_event_loop()
+            _LOOP_THREAD = threading.Thread(target=_LOOP.run_forever, name="ai-helper-grok-loop", daemon=True)
+            _LOOP_THREAD.start()
+        return _LOOP
+
+
 def _run_async(coro):
     try:
         loop = asyncio.get_running_loop()
@@ -351,6 +412,63 @@ def _run_async(coro):
         loop = None
 
     if loop and loop.is_running():
+        coro.close()
         raise RuntimeError("Async loop already running; use async integration")
 
-    return asyncio.run(coro)
+    future = asyncio.run_coroutine_threadsafe(coro, _ensure_loop())
+    _PENDING.add(future)
+    try:
+        return future.result(timeout=_REQUEST_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"Grok request timed out after {_REQUEST_TIMEOUT:.0f} s") from None
+    except concurrent.futures.CancelledError:
+        raise RuntimeError("Grok request cancelled") from None
+    finally:
+        _PENDING.discard(future)
+
+
+async def _close_all() -> None:
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    # Clients are only closed once nothing is still using them.
+    for adapter in list(_ADAPTERS):
+        try:
+            await adapter.aclose()
+        except Exception as exc:
+            logger.logger.warning("Grok client close failed: %s", exc)
+
+
+def close_adapter(adapter: GrokAdapter) -> None:
+    loop = _LOOP
+    if adapter._client is None or loop is None or loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(adapter.aclose(), loop).result(timeout=_SHUTDOWN_TIMEOUT)
+    except Exception as exc:
+        logger.logger.warning("Grok client close failed: %s", exc)
+
+
+def shutdown() -> None:
+    global _LOOP, _LOOP_THREAD
+    with _LOOP_LOCK:
+        loop, thread = _LOOP, _LOOP_THREAD
+        _LOOP = _LOOP_THREAD = None
+    if loop is None or loop.is_closed():
+        return
+
+    # Wake callers first; their in-flight tasks are cancelled on the loop below.
+    for future in list(_PENDING):
+        future.cancel()
+    try:
+        asyncio.run_coroutine_threadsafe(_close_all(), loop).result(timeout=_SHUTDOWN_TIMEOUT)
+    except Exception as exc:
+        logger.logger.warning("Grok loop shutdown incomplete: %s", exc)
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=_SHUTDOWN_TIMEOUT)
+    if not loop.is_running():
+        loop.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Dict, List, Tuple
 
 PRESETS: Dict[str, Dict[str, object]] = {
@@ -73,19 +74,18 @@ def preset_items() -> List[Tuple[str, str, str]]:
     return items
 
 
-def preset_fields(key: str) -> List[Tuple[str, str, float]]:
+@functools.lru_cache(maxsize=64)
+def preset_fields(key: str) -> Tuple[Tuple[str, str, float], ...]:
     preset = PRESETS.get(key, {})
     fields = preset.get("params", [])
-    return [(str(name), str(label), float(default)) for name, label, default in fields]
+    return tuple((str(name), str(label), float(default)) for name, label, default in fields)
 
 
 def preset_params(key: str) -> Dict[str, float]:
-    params: Dict[str, float] = {}
-    for name, _label, default in preset_fields(key):
-        params[name] = float(default)
-    return params
+    return {name: default for name, _label, default in preset_fields(key)}
 
 
+@functools.lru_cache(maxsize=64)
 def preset_prompt(key: str) -> str:
     return render_preset_prompt(key, {})
 
@@ -101,23 +101,33 @@ def render_preset_prompt(key: str, values: Dict[str, float]) -> str:
             continue
         params[name] = float(value)
 
-    builder_name = preset.get("builder")
-    if builder_name == "_build_plate_prompt":
-        return _build_plate_prompt(params)
-    if builder_name == "_build_bracket_prompt":
-        return _build_bracket_prompt(params)
-    if builder_name == "_build_slot_prompt":
-        return _build_slot_prompt(params)
-    if builder_name == "_build_frame_prompt":
-        return _build_frame_prompt(params)
-    if builder_name == "_build_bolt_circle_prompt":
-        return _build_bolt_circle_prompt(params)
-    if builder_name == "_build_slot_pair_prompt":
-        return _build_slot_pair_prompt(params)
+    builder = _preset_builder(key)
+    if builder is not None:
+        return builder(params)
 
     return str(preset.get("prompt", ""))
 
 
+@functools.lru_cache(maxsize=64)
+def _preset_builder(key: str):
+    builder_name = PRESETS.get(key, {}).get("builder")
+    if builder_name in _BUILDER_NAMES:
+        return globals()[builder_name]
+    return None
+
+
+_BUILDER_NAMES = frozenset(
+    (
+        "_build_plate_prompt",
+        "_build_bracket_prompt",
+        "_build_slot_prompt",
+        "_build_frame_prompt",
+        "_build_bolt_circle_prompt",
+        "_build_slot_pair_prompt",
+    )
+)
+
+
 def _build_plate_prompt(params: Dict[str, float]) -> str:
     width = params.get("width", 100.0)
     height = params.get("height", 60.0)
@@ -0,0 +1,8 @@
+SKETCH_OBJECT_NAME = "AI_Sketch"
+
+
+def get_sketch_object(context):
+    obj = context.scene.objects.get(SKETCH_OBJECT_NAME)
+    if obj is None or obj.type != "MESH":
+        return None
+    return obj
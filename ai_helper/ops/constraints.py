@@ -1,7 +1,12 @@
+import json
 import math
+from contextlib import contextmanager
+from operator import attrgetter
 
 import bpy
 import bmesh
+from ..core import logger
+from ..props import solver_payload
 from ..sketch.constraints import (
     AngleConstraint,
     CoincidentConstraint,
@@ -20,8 +25,6 @@ from ..sketch.constraints import (
 )
 from ..sketch.circles import (
     find_circle,
-    find_circle_by_center,
-    find_circle_by_vertex,
     load_circles,
     update_circle_radius,
 )
@@ -32,76 +35,138 @@ from ..sketch.dimensions import (
     update_dimensions,
 )
 from ..sketch.history import snapshot_state
-from ..sketch.solver_bridge import solve_mesh
+from ..sketch.solver_bridge import last_solve_moved, solve_mesh
 from ..sketch.store import (
     append_constraint,
     clear_constraints,
     load_constraints,
+    load_constraints_indexed,
     new_constraint_id,
     remove_constraint,
     save_constraints,
-    update_constraint,
+    update_constraint_by_id,
 )
 
 
+_WARN = {"WARNING"}
+_INFO = {"INFO"}
+
+_MSG_NO_SKETCH = "No sketch mesh found"
+_MSG_NEED_EDGE = "Select 1 edge"
+_MSG_NEED_2EDGES = "Select 2 edges"
+_MSG_NEED_2EDGES_SHARED = "Select 2 edges sharing a vertex"
+_MSG_NOT_FOUND = "Constraint not found"
+_MSG_CIRCLE_META = "Circle metadata missing"
+
+_KIND_TO_FIELD = {
+    "angle": (AngleConstraint, "degrees"),
+    "radius": (RadiusConstraint, "radius"),
+    "distance": (DistanceConstraint, "distance"),
+}
+
+_BUILDERS = {
+    DistanceConstraint: lambda c, op: DistanceConstraint(id=c.id, p1=c.p1, p2=c.p2, distance=op.distance),
+    AngleConstraint: lambda c, op: AngleConstraint(
+        id=c.id, p1=c.p1, vertex=c.vertex, p2=c.p2, degrees=op.degrees
+    ),
+    RadiusConstraint: lambda c, op: RadiusConstraint(id=c.id, entity=c.entity, radius=op.radius),
+}
+
+_LAST_DIAG = None
+
+_SOLVE_DELAY = 0.05
+_PENDING_SOLVE = None
+
+
+def _fail(op, message):
+    op.report(_WARN, message)
+    return {"CANCELLED"}
+
+
 def _get_sketch_object(context):
     obj = context.scene.objects.get("AI_Sketch")
     if obj is None or obj.type != "MESH":
         return None
+    if obj.mode == "EDIT":
+        # Flush the edit bmesh once so the helpers below can read obj.data in bulk.
+        obj.update_from_editmode()
     return obj
 
 
-def _selected_edge(obj):
-    for edge in obj.data.edges:
-        if edge.select:
-            return edge
-    return None
+def _take_sketch_object(op, context):
+    # Reuse the object found by invoke once, so a later redo looks it up again.
+    obj = getattr(op, "_sketch_obj", None)
+    if obj is not None:
+        op._sketch_obj = None
+        return obj
+    return _get_sketch_object(context)
+
 
+def _selection_snapshot(obj):
+    import numpy as np
 
-def _selected_edges(obj):
-    return [edge for edge in obj.data.edges if edge.select]
+    mesh = obj.data
+    vsel = np.empty(len(mesh.vertices), dtype=np.bool_)
+    mesh.vertices.foreach_get("select", vsel)
+    esel = np.empty(len(mesh.edges), dtype=np.bool_)
+    mesh.edges.foreach_get("select", esel)
+    return np.flatnonzero(vsel).tolist(), np.flatnonzero(esel).tolist()
+
+
+def _selected_edge(obj, sel):
+    edge_ids = sel[1]
+    return obj.data.edges[edge_ids[0]] if edge_ids else None
+
+
+def _selected_edges(obj, sel):
+    edges = obj.data.edges
+    return [edges[i] for i in sel[1]]
 
 
 def _shared_vertex_for_edges(edges):
     if len(edges) != 2:
         return None
-    verts_a = set(edges[0].vertices)
-    verts_b = set(edges[1].vertices)
-    shared = verts_a & verts_b
-    if not shared:
-        return None
-    vertex = shared.pop()
-    other_a = (verts_a - {vertex}).pop()
-    other_b = (verts_b - {vertex}).pop()
-    return other_a, vertex, other_b
+    a0, a1 = edges[0].vertices
+    b0, b1 = edges[1].vertices
+    if a0 == b0:
+        return a1, a0, b1
+    if a0 == b1:
+        return a1, a0, b0
+    if a1 == b0:
+        return a0, a1, b1
+    if a1 == b1:
+        return a0, a1, b0
+    return None
 
 
-def _selected_vertices(obj):
-    return [v for v in obj.data.vertices if v.select]
+def _selected_vertices(obj, sel):
+    vertices = obj.data.vertices
+    return [vertices[i] for i in sel[0]]
 
 
-def _selected_vertices_excluding_edge(obj, edge):
+def _selected_vertices_excluding_edge(obj, sel, edge):
     if edge is None:
-        return _selected_vertices(obj)
+        return _selected_vertices(obj, sel)
     excluded = set(edge.vertices)
-    return [v for v in _selected_vertices(obj) if v.index not in excluded]
+    vertices = obj.data.vertices
+    return [vertices[i] for i in sel[0] if i not in excluded]
 
 
-def _distance_targets(obj):
-    edge = _selected_edge(obj)
+def _distance_targets(obj, sel):
+    edge = _selected_edge(obj, sel)
     if edge is not None:
         v1 = obj.data.vertices[edge.vertices[0]]
         v2 = obj.data.vertices[edge.vertices[1]]
         return v1, v2
 
-    verts = _selected_vertices(obj)
-    if len(verts) == 2:
-        return verts[0], verts[1]
+    selected = sel[0]
+    if len(selected) == 2:
+        return obj.data.vertices[selected[0]], obj.data.vertices[selected[1]]
     return None
 
 
-def _angle_targets(obj):
-    edges = _selected_edges(obj)
+def _angle_targets(obj, sel):
+    edges = _selected_edges(obj, sel)
     shared = _shared_vertex_for_edges(edges)
     if shared is None:
         return None
@@ -114,106 +179,151 @@ def _angle_targets(obj):
     except IndexError:
         return None
 
-    v1_vec = v1.co - vtx.co
-    v2_vec = v2.co - vtx.co
-    len1 = v1_vec.length
-    len2 = v2_vec.length
-    if len1 < 1e-8 or len2 < 1e-8:
+    ox, oy, oz = vtx.co
+    ax, ay, az = v1.co
+    bx, by, bz = v2.co
+    ax -= ox
+    ay -= oy
+    az -= oz
+    bx -= ox
+    by -= oy
+    bz -= oz
+    if ax * ax + ay * ay + az * az < 1e-16 or bx * bx + by * by + bz * bz < 1e-16:
         return None
 
-    dot = v1_vec.dot(v2_vec)
-    cos_val = max(-1.0, min(1.0, dot / (len1 * len2)))
-    angle_deg = math.degrees(math.acos(cos_val))
+    cx = ay * bz - az * by
+    cy = az * bx - ax * bz
+    cz = ax * by - ay * bx
+    dot = ax * bx + ay * by + az * bz
+    angle_deg = math.degrees(math.atan2(math.sqrt(cx * cx + cy * cy + cz * cz), dot))
     return p1, vertex, p2, angle_deg
 
 
+def _coords_snapshot(obj):
+    import numpy as np
+
+    vertices = obj.data.vertices
+    coords = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+
+def _batch_edge_lengths(obj, coords=None):
+    import numpy as np
+
+    edges = obj.data.edges
+    edge_verts = np.empty(len(edges) * 2, dtype=np.int32)
+    edges.foreach_get("vertices", edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+    if coords is None:
+        coords = _coords_snapshot(obj)
+    return np.linalg.norm(coords[edge_verts[:, 1]] - coords[edge_verts[:, 0]], axis=1)
+
+
+def _batch_vertex_angles(coords, triples):
+    # triples is (K, 3) of (p1, vertex, p2); degrees via atan2(|cross|, dot) as in _angle_targets.
+    import numpy as np
+
+    triples = np.asarray(triples, dtype=np.intp).reshape(-1, 3)
+    origin = coords[triples[:, 1]]
+    a = coords[triples[:, 0]] - origin
+    b = coords[triples[:, 2]] - origin
+    cross = np.linalg.norm(np.cross(a, b), axis=1)
+    dot = np.einsum("ij,ij->i", a, b)
+    return np.degrees(np.arctan2(cross, dot))
+
+
 def _circle_current_radius(obj, circle):
+    import numpy as np
+
     center_id = circle.get("center")
     vert_ids = circle.get("verts", [])
     if center_id is None or not vert_ids:
         return None
 
+    vert_count = len(obj.data.vertices)
     try:
-        center = obj.data.vertices[int(center_id)].co
-    except (ValueError, IndexError):
+        center_idx = int(center_id)
+    except ValueError:
+        return None
+    if not 0 <= center_idx < vert_count:
         return None
 
     radius = float(circle.get("radius", 0.0))
     if radius > 0.0:
         return radius
 
-    total = 0.0
-    count = 0
-    for vid in vert_ids:
-        try:
-            vert = obj.data.vertices[int(vid)]
-        except (ValueError, IndexError):
-            continue
-        total += (vert.co - center).length
-        count += 1
-    if count == 0:
+    try:
+        indices = np.array(vert_ids, dtype=np.intp)
+    except ValueError:
+        indices = np.array([int(v) for v in vert_ids if v.lstrip("-").isdigit()], dtype=np.intp)
+    indices = indices[(indices >= 0) & (indices < vert_count)]
+    if not indices.size:
         return None
-    return total / count
+
+    coords = _coords_snapshot(obj)
+    offsets = coords[indices] - coords[center_idx]
+    return float(np.linalg.norm(offsets, axis=1).mean())
 
 
-def _selected_circle(obj):
+def _build_circle_index(circles):
+    by_vert = {}
+    by_center = {}
+    for circle in circles:
+        by_center.setdefault(circle.get("center"), circle)
+        for vid in circle.get("verts", []):
+            by_vert.setdefault(vid, circle)
+    return by_vert, by_center
+
+
+def _selected_circle(obj, sel):
     circles = load_circles(obj)
     if not circles:
         return None
 
-    for vert in obj.data.vertices:
-        if not vert.select:
-            continue
-        circle = find_circle_by_vertex(circles, str(vert.index))
-        if circle:
-            return circle
-        circle = find_circle_by_center(circles, str(vert.index))
+    by_vert, by_center = _build_circle_index(circles)
+    for vid in sel[0]:
+        key = str(vid)
+        circle = by_vert.get(key) or by_center.get(key)
         if circle:
             return circle
 
-    for edge in obj.data.edges:
-        if not edge.select:
-            continue
-        for vid in edge.vertices:
-            circle = find_circle_by_vertex(circles, str(vid))
+    edges = obj.data.edges
+    for eid in sel[1]:
+        for vid in edges[eid].vertices:
+            circle = by_vert.get(str(vid))
             if circle:
                 return circle
     return None
 
 
-def _selected_circles(obj):
+def _selected_circles(obj, sel):
     circles = load_circles(obj)
     if not circles:
         return []
 
-    found = []
-    seen = set()
+    by_vert, by_center = _build_circle_index(circles)
+    found = {}
 
-    for vert in obj.data.vertices:
-        if not vert.select:
-            continue
-        for circle in (
-            find_circle_by_vertex(circles, str(vert.index)),
-            find_circle_by_center(circles, str(vert.index)),
-        ):
-            if circle and circle.get("id") not in seen:
-                seen.add(circle.get("id"))
-                found.append(circle)
-
-    for edge in obj.data.edges:
-        if not edge.select:
-            continue
-        for vid in edge.vertices:
-            circle = find_circle_by_vertex(circles, str(vid))
-            if circle and circle.get("id") not in seen:
-                seen.add(circle.get("id"))
-                found.append(circle)
+    for vid in sel[0]:
+        key = str(vid)
+        for circle in (by_vert.get(key), by_center.get(key)):
+            if circle:
+                found.setdefault(circle.get("id"), circle)
 
-    return found
+    edges = obj.data.edges
+    for eid in sel[1]:
+        for vid in edges[eid].vertices:
+            circle = by_vert.get(str(vid))
+            if circle:
+                found.setdefault(circle.get("id"), circle)
 
+    return list(found.values())
 
-def _update_tangent_radii(obj, circle_id: str, radius: float) -> None:
-    constraints = load_constraints(obj)
+
+def _update_tangent_radii(obj, circle_id: str, radius: float, constraints=None):
+    if constraints is None:
+        constraints = load_constraints(obj)
     updated = False
     for idx, constraint in enumerate(constraints):
         if isinstance(constraint, TangentConstraint) and constraint.circle == circle_id:
@@ -227,40 +337,61 @@ def _update_tangent_radii(obj, circle_id: str, radius: float) -> None:
             updated = True
     if updated:
         save_constraints(obj, constraints)
+    return constraints
 
 
-def _set_selection(obj, verts=None, edges=None, extend=False):
-    verts = verts or []
-    edges = edges or []
+@contextmanager
+def _edit_bmesh(obj):
+    bm = bmesh.from_edit_mesh(obj.data)
+    bm.verts.ensure_lookup_table()
+    bm.edges.ensure_lookup_table()
+    yield bm
+    bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
-    if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(obj.data)
-        if not extend:
-            for v in bm.verts:
-                v.select = False
-            for e in bm.edges:
-                e.select = False
-        for vid in verts:
-            if 0 <= vid < len(bm.verts):
-                bm.verts[vid].select = True
-        for eid in edges:
-            if 0 <= eid < len(bm.edges):
-                bm.edges[eid].select = True
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
-        return
 
+def _select_bmesh(bm, verts, edges, extend):
+    bm_verts = bm.verts
+    bm_edges = bm.edges
     if not extend:
-        for v in obj.data.vertices:
+        for v in bm_verts:
             v.select = False
-        for e in obj.data.edges:
+        for e in bm_edges:
             e.select = False
+    vert_count = len(bm_verts)
     for vid in verts:
-        if 0 <= vid < len(obj.data.vertices):
-            obj.data.vertices[vid].select = True
+        if 0 <= vid < vert_count:
+            bm_verts[vid].select = True
+    edge_count = len(bm_edges)
     for eid in edges:
-        if 0 <= eid < len(obj.data.edges):
-            obj.data.edges[eid].select = True
-    obj.data.update()
+        if 0 <= eid < edge_count:
+            bm_edges[eid].select = True
+
+
+def _set_selection(obj, verts=None, edges=None, extend=False, bm=None):
+    verts = verts or []
+    edges = edges or []
+
+    if bm is not None:
+        # The caller owns the bmesh and flushes it once when it is done.
+        _select_bmesh(bm, verts, edges, extend)
+        return
+
+    if obj.mode == "EDIT":
+        with _edit_bmesh(obj) as edit_bm:
+            _select_bmesh(edit_bm, verts, edges, extend)
+        return
+
+    import numpy as np
+
+    mesh = obj.data
+    for collection, indices in ((mesh.vertices, verts), (mesh.edges, edges)):
+        count = len(collection)
+        sel = np.zeros(count, dtype=np.bool_)
+        if extend:
+            collection.foreach_get("select", sel)
+        sel[np.array([i for i in indices if 0 <= i < count], dtype=np.intp)] = True
+        collection.foreach_set("select", sel)
+    mesh.update()
 
 
 def _format_diag(diag):
@@ -270,70 +401,163 @@ def _format_diag(diag):
 
 
 def _base_constraint_id(constraint_id):
-    if not constraint_id:
-        return ""
-    return constraint_id.split(":", 1)[0]
+    return constraint_id.partition(":")[0] if constraint_id else ""
 
 
 def _format_diag_details(diag):
-    lines = []
-    for entry in diag.worst_constraints:
-        base_id = _base_constraint_id(entry.constraint_id)
-        cid = base_id or "?"
-        short = cid[:6] if cid != "?" else cid
-        lines.append(f"{entry.kind} {short} err={entry.error:.4f}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"{entry.kind} {(_base_constraint_id(entry.constraint_id) or '?')[:6]} err={entry.error:.4f}"
+        for entry in diag.worst_constraints
+    )
+
+
+def _write_solver_payload(props, **fields):
+    payload = dict(solver_payload(props))
+    payload.update(fields)
+    props.last_solver_payload = json.dumps(payload) if any(payload.values()) else ""
+
+
+def _clear_solver_report(props):
+    global _LAST_DIAG
+    _LAST_DIAG = None
+    props.last_solver_payload = ""
+
+
+def refresh_solver_report(context):
+    global _LAST_DIAG
+    props = context.scene.ai_helper
+    if _LAST_DIAG is not None and props.show_solver_report:
+        _write_solver_payload(props, r=_format_diag(_LAST_DIAG), d=_format_diag_details(_LAST_DIAG))
+        _LAST_DIAG = None
 
 
 def _update_solver_report(context, diag):
+    global _LAST_DIAG
     props = context.scene.ai_helper
-    props.last_solver_report = _format_diag(diag)
-    props.last_solver_details = _format_diag_details(diag)
-    props.last_solver_worst_id = _base_constraint_id(diag.worst_constraint_id)
+    fields = {"w": _base_constraint_id(diag.worst_constraint_id)}
+    if props.show_solver_report:
+        _LAST_DIAG = None
+        fields["r"] = _format_diag(diag)
+        fields["d"] = _format_diag_details(diag)
+    else:
+        # Formatting is deferred until the diagnostics are shown again.
+        _LAST_DIAG = diag
+    _write_solver_payload(props, **fields)
     obj = context.scene.objects.get("AI_Sketch")
     if obj is not None and obj.type == "MESH":
         snapshot_state(obj, "Constraints Update")
 
 
+def _resolve_and_refresh(context, obj, constraints=None, changed_ids=None):
+    if constraints is None:
+        constraints = load_constraints(obj)
+    diag = solve_mesh(obj, constraints)
+    if last_solve_moved():
+        changed_ids = None
+    # Labels are refreshed here, inside the operator, so they land in the same undo step.
+    update_dimensions(context, obj, constraints, changed_ids)
+    _update_solver_report(context, diag)
+
+
+def _flush_solve():
+    global _PENDING_SOLVE
+    name = _PENDING_SOLVE
+    _PENDING_SOLVE = None
+    obj = bpy.data.objects.get(name) if name else None
+    if obj is None or obj.type != "MESH":
+        return None
+    if obj.mode == "EDIT":
+        obj.update_from_editmode()
+    context = bpy.context
+    constraints = load_constraints(obj)
+    diag = solve_mesh(obj, constraints)
+    update_dimensions(context, obj, constraints)
+    _update_solver_report(context, diag)
+    # The operator's undo step was pushed before this timer fired, so record the solved state too.
+    bpy.ops.ed.undo_push(message="Solve Constraints")
+    return None
+
+
+def _schedule_solve(obj):
+    global _PENDING_SOLVE
+    _PENDING_SOLVE = obj.name
+    if bpy.app.timers.is_registered(_flush_solve):
+        bpy.app.timers.unregister(_flush_solve)
+    bpy.app.timers.register(_flush_solve, first_interval=_SOLVE_DELAY)
+
+
+def _cancel_solve():
+    global _PENDING_SOLVE
+    _PENDING_SOLVE = None
+    if bpy.app.timers.is_registered(_flush_solve):
+        bpy.app.timers.unregister(_flush_solve)
+
+
+def _solve_or_schedule(context, obj, constraints, changed_ids=None):
+    if context.scene.ai_helper.defer_solve and not bpy.app.background:
+        _schedule_solve(obj)
+        return
+    _resolve_and_refresh(context, obj, constraints, changed_ids)
+
+
+def _circle_verts(obj, circle_id):
+    circle = find_circle(load_circles(obj), circle_id)
+    if not circle:
+        return []
+    return [int(v) for v in circle.get("verts", [])]
+
+
+# (vertex id fields, edge id fields) selected for each constraint type.
+_SELECT_FIELDS = {
+    DistanceConstraint: (("p1", "p2"), ()),
+    AngleConstraint: (("p1", "vertex", "p2"), ()),
+    FixConstraint: (("point",), ()),
+    CoincidentConstraint: (("p1", "p2"), ()),
+    RadiusConstraint: ((), ()),
+    MidpointConstraint: (("point",), ("line",)),
+    EqualLengthConstraint: ((), ("line_a", "line_b")),
+    ConcentricConstraint: (("p1", "p2"), ()),
+    SymmetryConstraint: (("p1", "p2"), ("line",)),
+    TangentConstraint: ((), ("line",)),
+    HorizontalConstraint: ((), ("line",)),
+    VerticalConstraint: ((), ("line",)),
+    ParallelConstraint: ((), ("line_a", "line_b")),
+    PerpendicularConstraint: ((), ("line_a", "line_b")),
+}
+
+# Circle-backed constraints also select the circle's sample vertices.
+_CIRCLE_GETTERS = {
+    RadiusConstraint: attrgetter("entity"),
+    TangentConstraint: attrgetter("circle"),
+}
+
+
+def _ids_getter(names):
+    if not names:
+        return None
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return lambda c: (getter(c),)
+    return getter
+
+
+_SELECT_GETTERS = {
+    cls: (_ids_getter(vert_fields), _ids_getter(edge_fields))
+    for cls, (vert_fields, edge_fields) in _SELECT_FIELDS.items()
+}
+
+
 def _select_constraint_geometry(obj, constraint, extend=False):
-    verts = []
-    edges = []
-    if isinstance(constraint, DistanceConstraint):
-        verts = [int(constraint.p1), int(constraint.p2)]
-    elif isinstance(constraint, AngleConstraint):
-        verts = [int(constraint.p1), int(constraint.vertex), int(constraint.p2)]
-    elif isinstance(constraint, FixConstraint):
-        verts = [int(constraint.point)]
-    elif isinstance(constraint, CoincidentConstraint):
-        verts = [int(constraint.p1), int(constraint.p2)]
-    elif isinstance(constraint, RadiusConstraint):
-        circles = load_circles(obj)
-        circle = find_circle(circles, constraint.entity)
-        if circle:
-            verts = [int(v) for v in circle.get("verts", [])]
-    elif isinstance(constraint, MidpointConstraint):
-        edges = [int(constraint.line)]
-        verts = [int(constraint.point)]
-    elif isinstance(constraint, EqualLengthConstraint):
-        edges = [int(constraint.line_a), int(constraint.line_b)]
-    elif isinstance(constraint, ConcentricConstraint):
-        verts = [int(constraint.p1), int(constraint.p2)]
-    elif isinstance(constraint, SymmetryConstraint):
-        edges = [int(constraint.line)]
-        verts = [int(constraint.p1), int(constraint.p2)]
-    elif isinstance(constraint, TangentConstraint):
-        edges = [int(constraint.line)]
-        circles = load_circles(obj)
-        circle = find_circle(circles, constraint.circle)
-        if circle:
-            verts = [int(v) for v in circle.get("verts", [])]
-    elif isinstance(constraint, (HorizontalConstraint, VerticalConstraint)):
-        edges = [int(constraint.line)]
-    elif isinstance(constraint, (ParallelConstraint, PerpendicularConstraint)):
-        edges = [int(constraint.line_a), int(constraint.line_b)]
-    else:
+    getters = _SELECT_GETTERS.get(type(constraint))
+    if getters is None:
         return False, "Constraint type not supported for selection"
 
+    vert_getter, edge_getter = getters
+    verts = [int(v) for v in vert_getter(constraint)] if vert_getter else []
+    edges = [int(e) for e in edge_getter(constraint)] if edge_getter else []
+    circle_getter = _CIRCLE_GETTERS.get(type(constraint))
+    if circle_getter is not None:
+        verts = _circle_verts(obj, circle_getter(constraint))
     if not verts and not edges:
         return False, "No geometry found for constraint"
 
@@ -341,11 +565,79 @@ def _select_constraint_geometry(obj, constraint, extend=False):
     return True, ""
 
 
-class AIHELPER_OT_add_distance_constraint(bpy.types.Operator):
+class _DistanceProps:
+    distance: bpy.props.FloatProperty(
+        name="Distance",
+        description="Target distance",
+        min=0.0,
+        default=1.0,
+    )
+
+
+class _AngleProps:
+    degrees: bpy.props.FloatProperty(
+        name="Angle",
+        description="Target angle in degrees",
+        min=0.0,
+        max=180.0,
+        default=90.0,
+    )
+
+
+class _RadiusProps:
+    radius: bpy.props.FloatProperty(
+        name="Radius",
+        description="Target radius",
+        min=0.0,
+        default=1.0,
+    )
+
+
+class _ConstraintIdProps:
+    constraint_id: bpy.props.StringProperty()
+
+
+class _SkipDialogProps:
+    skip_dialog: bpy.props.BoolProperty(default=False, options={"HIDDEN", "SKIP_SAVE"})
+
+
+class _AddConstraintOperator:
+    bl_options = {"REGISTER", "UNDO"}
+    _added_message = ""
+
+    def _selection(self, obj):
+        # invoke() and execute() run on the same instance; scan the selection once.
+        sel = getattr(self, "_selection_cache", None)
+        if sel is None:
+            sel = _selection_snapshot(obj)
+            self._selection_cache = sel
+        return sel
+
+    def _after_append(self, obj, constraint, constraints):
+        return constraints
+
+    def execute(self, context):
+        obj = _get_sketch_object(context)
+        if obj is None:
+            return _fail(self, _MSG_NO_SKETCH)
+
+        constraint, error = self._build(obj)
+        if constraint is None:
+            return _fail(self, error)
+        constraints = append_constraint(obj, constraint)
+        constraints = self._after_append(obj, constraint, constraints)
+
+        _solve_or_schedule(context, obj, constraints)
+
+        self.report(_INFO, self._added_message)
+        return {"FINISHED"}
+
+
+class AIHELPER_OT_add_distance_constraint(_SkipDialogProps, _AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_distance_constraint"
     bl_label = "Add Distance"
     bl_description = "Add a distance constraint to selected edge or vertices"
-    bl_options = {"REGISTER", "UNDO"}
+    _added_message = "Distance constraint added"
 
     distance: bpy.props.FloatProperty(
         name="Distance",
@@ -355,30 +647,24 @@ class AIHELPER_OT_add_distance_constraint(bpy.types.Operator):
     )
 
     def invoke(self, context, _event):
+        if self.skip_dialog:
+            return self.execute(context)
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
-        targets = _distance_targets(obj)
+        targets = _distance_targets(obj, self._selection(obj))
         if targets is None:
-            self.report({"WARNING"}, "Select 1 edge or 2 vertices")
-            return {"CANCELLED"}
+            return _fail(self, "Select 1 edge or 2 vertices")
 
         v1, v2 = targets
         self.distance = (v2.co - v1.co).length
         return context.window_manager.invoke_props_dialog(self)
 
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        targets = _distance_targets(obj)
+    def _build(self, obj):
+        targets = _distance_targets(obj, self._selection(obj))
         if targets is None:
-            self.report({"WARNING"}, "Select 1 edge or 2 vertices")
-            return {"CANCELLED"}
+            return None, "Select 1 edge or 2 vertices"
         v1, v2 = targets
 
         current = (v2.co - v1.co).length
@@ -390,111 +676,62 @@ class AIHELPER_OT_add_distance_constraint(bpy.types.Operator):
             p2=str(v2.index),
             distance=target,
         )
-        append_constraint(obj, constraint)
+        return constraint, None
 
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Distance constraint added")
-        return {"FINISHED"}
 
-
-class AIHELPER_OT_add_horizontal_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_horizontal_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_horizontal_constraint"
     bl_label = "Add Horizontal"
     bl_description = "Add a horizontal constraint to selected edge"
-    bl_options = {"REGISTER", "UNDO"}
-
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+    _added_message = "Horizontal constraint added"
 
-        edge = _selected_edge(obj)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edge = _selected_edge(obj, sel)
         if edge is None:
-            self.report({"WARNING"}, "Select 1 edge")
-            return {"CANCELLED"}
-
-        constraint = HorizontalConstraint(id=new_constraint_id(), line=str(edge.index))
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Horizontal constraint added")
-        return {"FINISHED"}
+            return None, _MSG_NEED_EDGE
+        return HorizontalConstraint(id=new_constraint_id(), line=str(edge.index)), None
 
 
-class AIHELPER_OT_add_vertical_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_vertical_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_vertical_constraint"
     bl_label = "Add Vertical"
     bl_description = "Add a vertical constraint to selected edge"
-    bl_options = {"REGISTER", "UNDO"}
-
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+    _added_message = "Vertical constraint added"
 
-        edge = _selected_edge(obj)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edge = _selected_edge(obj, sel)
         if edge is None:
-            self.report({"WARNING"}, "Select 1 edge")
-            return {"CANCELLED"}
-
-        constraint = VerticalConstraint(id=new_constraint_id(), line=str(edge.index))
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Vertical constraint added")
-        return {"FINISHED"}
+            return None, _MSG_NEED_EDGE
+        return VerticalConstraint(id=new_constraint_id(), line=str(edge.index)), None
 
 
-class AIHELPER_OT_add_angle_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_angle_constraint(_AngleProps, _SkipDialogProps, _AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_angle_constraint"
     bl_label = "Add Angle"
     bl_description = "Add an angle constraint between two connected edges"
-    bl_options = {"REGISTER", "UNDO"}
-
-    degrees: bpy.props.FloatProperty(
-        name="Angle",
-        description="Target angle in degrees",
-        default=90.0,
-        min=0.0,
-        max=180.0,
-    )
+    _added_message = "Angle constraint added"
 
     def invoke(self, context, _event):
+        if self.skip_dialog:
+            return self.execute(context)
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
-        targets = _angle_targets(obj)
+        targets = _angle_targets(obj, self._selection(obj))
         if targets is None:
-            self.report({"WARNING"}, "Select 2 edges sharing a vertex")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NEED_2EDGES_SHARED)
 
         _p1, _vertex, _p2, angle_deg = targets
         self.degrees = angle_deg
         return context.window_manager.invoke_props_dialog(self)
 
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        targets = _angle_targets(obj)
+    def _build(self, obj):
+        targets = _angle_targets(obj, self._selection(obj))
         if targets is None:
-            self.report({"WARNING"}, "Select 2 edges sharing a vertex")
-            return {"CANCELLED"}
+            return None, _MSG_NEED_2EDGES_SHARED
 
         p1, vertex, p2, _angle_deg = targets
         constraint = AngleConstraint(
@@ -504,248 +741,162 @@ class AIHELPER_OT_add_angle_constraint(bpy.types.Operator):
             p2=str(p2),
             degrees=self.degrees,
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Angle constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_radius_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_radius_constraint(_RadiusProps, _SkipDialogProps, _AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_radius_constraint"
     bl_label = "Add Radius"
     bl_description = "Add a radius constraint to a circle"
-    bl_options = {"REGISTER", "UNDO"}
-
-    radius: bpy.props.FloatProperty(
-        name="Radius",
-        description="Target radius",
-        min=0.0,
-        default=1.0,
-    )
+    _added_message = "Radius constraint added"
 
     def invoke(self, context, _event):
+        if self.skip_dialog:
+            return self.execute(context)
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
-        circle = _selected_circle(obj)
+        circle = _selected_circle(obj, self._selection(obj))
         if circle is None:
-            self.report({"WARNING"}, "Select a circle vertex or edge")
-            return {"CANCELLED"}
+            return _fail(self, "Select a circle vertex or edge")
 
         radius = _circle_current_radius(obj, circle)
         if radius is None:
-            self.report({"WARNING"}, "Circle metadata missing")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_CIRCLE_META)
 
         self.radius = radius
         return context.window_manager.invoke_props_dialog(self)
 
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        circle = _selected_circle(obj)
+    def _build(self, obj):
+        circle = _selected_circle(obj, self._selection(obj))
         if circle is None:
-            self.report({"WARNING"}, "Select a circle vertex or edge")
-            return {"CANCELLED"}
+            return None, "Select a circle vertex or edge"
 
         radius = self.radius
         if radius <= 0.0:
             radius = _circle_current_radius(obj, circle)
             if radius is None:
-                self.report({"WARNING"}, "Circle metadata missing")
-                return {"CANCELLED"}
+                return None, _MSG_CIRCLE_META
 
         constraint = RadiusConstraint(
             id=new_constraint_id(),
             entity=str(circle["id"]),
             radius=radius,
         )
-        append_constraint(obj, constraint)
-        update_circle_radius(obj, constraint.entity, radius)
-        _update_tangent_radii(obj, constraint.entity, radius)
+        return constraint, None
 
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Radius constraint added")
-        return {"FINISHED"}
+    def _after_append(self, obj, constraint, constraints):
+        update_circle_radius(obj, constraint.entity, constraint.radius)
+        return _update_tangent_radii(obj, constraint.entity, constraint.radius, constraints)
 
 
-class AIHELPER_OT_add_coincident_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_coincident_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_coincident_constraint"
     bl_label = "Add Coincident"
     bl_description = "Make two selected vertices coincident"
-    bl_options = {"REGISTER", "UNDO"}
-
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+    _added_message = "Coincident constraint added"
 
-        verts = _selected_vertices(obj)
-        if len(verts) != 2:
-            self.report({"WARNING"}, "Select 2 vertices")
-            return {"CANCELLED"}
+    def _build(self, obj):
+        selected = self._selection(obj)[0]
+        if len(selected) != 2:
+            return None, "Select 2 vertices"
 
         constraint = CoincidentConstraint(
             id=new_constraint_id(),
-            p1=str(verts[0].index),
-            p2=str(verts[1].index),
+            p1=str(selected[0]),
+            p2=str(selected[1]),
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Coincident constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_midpoint_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_midpoint_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_midpoint_constraint"
     bl_label = "Add Midpoint"
     bl_description = "Make a selected vertex the midpoint of a selected edge"
-    bl_options = {"REGISTER", "UNDO"}
-
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+    _added_message = "Midpoint constraint added"
 
-        edge = _selected_edge(obj)
-        verts = _selected_vertices(obj)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edge = _selected_edge(obj, sel)
+        verts = _selected_vertices(obj, sel)
         if edge is None or len(verts) != 1:
-            self.report({"WARNING"}, "Select 1 edge and 1 vertex")
-            return {"CANCELLED"}
+            return None, "Select 1 edge and 1 vertex"
 
         vertex = verts[0]
         if vertex.index in edge.vertices:
-            self.report({"WARNING"}, "Select a vertex not on the edge")
-            return {"CANCELLED"}
+            return None, "Select a vertex not on the edge"
 
         constraint = MidpointConstraint(
             id=new_constraint_id(),
             line=str(edge.index),
             point=str(vertex.index),
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Midpoint constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_equal_length_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_equal_length_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_equal_length_constraint"
     bl_label = "Add Equal Length"
     bl_description = "Make two selected edges have equal length"
-    bl_options = {"REGISTER", "UNDO"}
+    _added_message = "Equal length constraint added"
 
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        edges = _selected_edges(obj)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edges = _selected_edges(obj, sel)
         if len(edges) != 2:
-            self.report({"WARNING"}, "Select 2 edges")
-            return {"CANCELLED"}
+            return None, _MSG_NEED_2EDGES
 
         constraint = EqualLengthConstraint(
             id=new_constraint_id(),
             line_a=str(edges[0].index),
             line_b=str(edges[1].index),
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Equal length constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_concentric_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_concentric_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_concentric_constraint"
     bl_label = "Add Concentric"
     bl_description = "Make two circles share the same center"
-    bl_options = {"REGISTER", "UNDO"}
-
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+    _added_message = "Concentric constraint added"
 
-        circles = _selected_circles(obj)
+    def _build(self, obj):
+        circles = _selected_circles(obj, self._selection(obj))
         if len(circles) != 2:
-            self.report({"WARNING"}, "Select 2 circles")
-            return {"CANCELLED"}
+            return None, "Select 2 circles"
 
         c1, c2 = circles
         center1 = c1.get("center")
         center2 = c2.get("center")
         if not center1 or not center2:
-            self.report({"WARNING"}, "Circle metadata missing")
-            return {"CANCELLED"}
+            return None, _MSG_CIRCLE_META
         if center1 == center2:
-            self.report({"WARNING"}, "Circles already concentric")
-            return {"CANCELLED"}
+            return None, "Circles already concentric"
 
         constraint = ConcentricConstraint(
             id=new_constraint_id(),
             p1=str(center1),
             p2=str(center2),
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Concentric constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_symmetry_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_symmetry_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_symmetry_constraint"
     bl_label = "Add Symmetry"
     bl_description = "Make two vertices symmetric about a selected edge"
-    bl_options = {"REGISTER", "UNDO"}
+    _added_message = "Symmetry constraint added"
 
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        edge = _selected_edge(obj)
-        verts = _selected_vertices_excluding_edge(obj, edge)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edge = _selected_edge(obj, sel)
+        verts = _selected_vertices_excluding_edge(obj, sel, edge)
         if edge is None or len(verts) != 2:
-            self.report({"WARNING"}, "Select 1 edge and 2 vertices")
-            return {"CANCELLED"}
+            return None, "Select 1 edge and 2 vertices"
 
         if verts[0].index == verts[1].index:
-            self.report({"WARNING"}, "Select 2 distinct vertices")
-            return {"CANCELLED"}
+            return None, "Select 2 distinct vertices"
 
         constraint = SymmetryConstraint(
             id=new_constraint_id(),
@@ -753,39 +904,26 @@ class AIHELPER_OT_add_symmetry_constraint(bpy.types.Operator):
             p1=str(verts[0].index),
             p2=str(verts[1].index),
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Symmetry constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_tangent_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_tangent_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_tangent_constraint"
     bl_label = "Add Tangent"
     bl_description = "Make a selected edge tangent to a selected circle"
-    bl_options = {"REGISTER", "UNDO"}
-
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+    _added_message = "Tangent constraint added"
 
-        edge = _selected_edge(obj)
-        circle = _selected_circle(obj)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edge = _selected_edge(obj, sel)
+        circle = _selected_circle(obj, sel)
         if edge is None or circle is None:
-            self.report({"WARNING"}, "Select 1 edge and 1 circle")
-            return {"CANCELLED"}
+            return None, "Select 1 edge and 1 circle"
 
         center = circle.get("center")
         radius = _circle_current_radius(obj, circle)
         if not center or radius is None:
-            self.report({"WARNING"}, "Circle metadata missing")
-            return {"CANCELLED"}
+            return None, _MSG_CIRCLE_META
 
         constraint = TangentConstraint(
             id=new_constraint_id(),
@@ -794,107 +932,60 @@ class AIHELPER_OT_add_tangent_constraint(bpy.types.Operator):
             center=str(center),
             radius=radius,
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Tangent constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_parallel_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_parallel_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_parallel_constraint"
     bl_label = "Add Parallel"
     bl_description = "Add a parallel constraint to two selected edges"
-    bl_options = {"REGISTER", "UNDO"}
+    _added_message = "Parallel constraint added"
 
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        edges = _selected_edges(obj)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edges = _selected_edges(obj, sel)
         if len(edges) != 2:
-            self.report({"WARNING"}, "Select 2 edges")
-            return {"CANCELLED"}
+            return None, _MSG_NEED_2EDGES
 
         constraint = ParallelConstraint(
             id=new_constraint_id(),
             line_a=str(edges[0].index),
             line_b=str(edges[1].index),
         )
-        append_constraint(obj, constraint)
+        return constraint, None
 
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
 
-        self.report({"INFO"}, "Parallel constraint added")
-        return {"FINISHED"}
-
-
-class AIHELPER_OT_add_perpendicular_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_perpendicular_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_perpendicular_constraint"
     bl_label = "Add Perpendicular"
     bl_description = "Add a perpendicular constraint to two selected edges"
-    bl_options = {"REGISTER", "UNDO"}
-
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+    _added_message = "Perpendicular constraint added"
 
-        edges = _selected_edges(obj)
+    def _build(self, obj):
+        sel = self._selection(obj)
+        edges = _selected_edges(obj, sel)
         if len(edges) != 2:
-            self.report({"WARNING"}, "Select 2 edges")
-            return {"CANCELLED"}
+            return None, _MSG_NEED_2EDGES
 
         constraint = PerpendicularConstraint(
             id=new_constraint_id(),
             line_a=str(edges[0].index),
             line_b=str(edges[1].index),
         )
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Perpendicular constraint added")
-        return {"FINISHED"}
+        return constraint, None
 
 
-class AIHELPER_OT_add_fix_constraint(bpy.types.Operator):
+class AIHELPER_OT_add_fix_constraint(_AddConstraintOperator, bpy.types.Operator):
     bl_idname = "aihelper.add_fix_constraint"
     bl_label = "Add Fix"
     bl_description = "Lock selected vertex in place"
-    bl_options = {"REGISTER", "UNDO"}
+    _added_message = "Fix constraint added"
 
-    def execute(self, context):
-        obj = _get_sketch_object(context)
-        if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        verts = _selected_vertices(obj)
-        if len(verts) != 1:
-            self.report({"WARNING"}, "Select 1 vertex")
-            return {"CANCELLED"}
-
-        v = verts[0]
-        constraint = FixConstraint(id=new_constraint_id(), point=str(v.index))
-        append_constraint(obj, constraint)
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-
-        self.report({"INFO"}, "Fix constraint added")
-        return {"FINISHED"}
+    def _build(self, obj):
+        selected = self._selection(obj)[0]
+        if len(selected) != 1:
+            return None, "Select 1 vertex"
+        return FixConstraint(id=new_constraint_id(), point=str(selected[0])), None
 
 
 class AIHELPER_OT_solve_constraints(bpy.types.Operator):
@@ -906,19 +997,18 @@ class AIHELPER_OT_solve_constraints(bpy.types.Operator):
     def execute(self, context):
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
+        _cancel_solve()
         constraints = load_constraints(obj)
         if not constraints:
-            self.report({"WARNING"}, "No constraints to solve")
-            return {"CANCELLED"}
+            return _fail(self, "No constraints to solve")
 
         diag = solve_mesh(obj, constraints)
         update_dimensions(context, obj, constraints)
         _update_solver_report(context, diag)
 
-        self.report({"INFO"}, "Constraints solved")
+        self.report(_INFO, "Constraints solved")
         return {"FINISHED"}
 
 
@@ -931,16 +1021,13 @@ class AIHELPER_OT_clear_constraints(bpy.types.Operator):
     def execute(self, context):
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
         clear_constraints(obj)
         clear_dimensions(context)
-        context.scene.ai_helper.last_solver_report = ""
-        context.scene.ai_helper.last_solver_details = ""
-        context.scene.ai_helper.last_solver_worst_id = ""
+        _clear_solver_report(context.scene.ai_helper)
         snapshot_state(obj, "Constraints Cleared")
-        self.report({"INFO"}, "Constraints cleared")
+        self.report(_INFO, "Constraints cleared")
         return {"FINISHED"}
 
 
@@ -951,11 +1038,8 @@ class AIHELPER_OT_clear_solver_report(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
-        props = context.scene.ai_helper
-        props.last_solver_report = ""
-        props.last_solver_details = ""
-        props.last_solver_worst_id = ""
-        self.report({"INFO"}, "Diagnostics cleared")
+        _clear_solver_report(context.scene.ai_helper)
+        self.report(_INFO, "Diagnostics cleared")
         return {"FINISHED"}
 
 
@@ -968,12 +1052,11 @@ class AIHELPER_OT_update_dimensions(bpy.types.Operator):
     def execute(self, context):
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
         constraints = load_constraints(obj)
         update_dimensions(context, obj, constraints)
-        self.report({"INFO"}, "Dimensions updated")
+        self.report(_INFO, "Dimensions updated")
         return {"FINISHED"}
 
 
@@ -985,229 +1068,157 @@ class AIHELPER_OT_clear_dimensions(bpy.types.Operator):
 
     def execute(self, context):
         clear_dimensions(context)
-        self.report({"INFO"}, "Dimensions cleared")
+        self.report(_INFO, "Dimensions cleared")
         return {"FINISHED"}
 
 
-class AIHELPER_OT_edit_distance_constraint(bpy.types.Operator):
+def _edit_value(op, obj, constraint_id: str, cls):
+    _constraints, index = load_constraints_indexed(obj)
+    current = index.get(constraint_id)
+    if type(current) is not cls:
+        return None
+    if cls is RadiusConstraint:
+        update_circle_radius(obj, current.entity, op.radius)
+    constraints = update_constraint_by_id(obj, constraint_id, _BUILDERS[cls](current, op))
+    if cls is RadiusConstraint:
+        constraints = _update_tangent_radii(obj, current.entity, op.radius, constraints)
+    return constraints
+
+
+class AIHELPER_OT_edit_distance_constraint(
+    _ConstraintIdProps, _DistanceProps, _SkipDialogProps, bpy.types.Operator
+):
     bl_idname = "aihelper.edit_distance_constraint"
     bl_label = "Edit Distance"
     bl_description = "Edit a distance constraint value"
     bl_options = {"REGISTER", "UNDO"}
 
-    constraint_id: bpy.props.StringProperty()
-    distance: bpy.props.FloatProperty(
-        name="Distance",
-        description="Target distance",
-        min=0.0,
-        default=1.0,
-    )
-
     def invoke(self, context, _event):
-        obj = _get_sketch_object(context)
+        if self.skip_dialog:
+            return self.execute(context)
+        obj = self._sketch_obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
-        constraints = load_constraints(obj)
-        for constraint in constraints:
-            if getattr(constraint, "id", None) == self.constraint_id and isinstance(constraint, DistanceConstraint):
-                self.distance = constraint.distance
-                break
+        _constraints, index = load_constraints_indexed(obj)
+        constraint = index.get(self.constraint_id)
+        if isinstance(constraint, DistanceConstraint):
+            self.distance = constraint.distance
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context):
-        obj = _get_sketch_object(context)
+        obj = _take_sketch_object(self, context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        def updater(constraint):
-            if isinstance(constraint, DistanceConstraint):
-                return DistanceConstraint(
-                    id=constraint.id,
-                    p1=constraint.p1,
-                    p2=constraint.p2,
-                    distance=self.distance,
-                )
-            return constraint
-
-        if not update_constraint(obj, self.constraint_id, updater):
-            self.report({"WARNING"}, "Constraint not found")
-            return {"CANCELLED"}
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
+            return _fail(self, _MSG_NO_SKETCH)
+
+        constraints = _edit_value(self, obj, self.constraint_id, DistanceConstraint)
+        if constraints is None:
+            return _fail(self, _MSG_NOT_FOUND)
+
+        _resolve_and_refresh(context, obj, constraints, {self.constraint_id})
 
-        self.report({"INFO"}, "Distance updated")
+        self.report(_INFO, "Distance updated")
         return {"FINISHED"}
 
 
-class AIHELPER_OT_edit_angle_constraint(bpy.types.Operator):
+class AIHELPER_OT_edit_angle_constraint(_ConstraintIdProps, _AngleProps, _SkipDialogProps, bpy.types.Operator):
     bl_idname = "aihelper.edit_angle_constraint"
     bl_label = "Edit Angle"
     bl_description = "Edit an angle constraint value"
     bl_options = {"REGISTER", "UNDO"}
 
-    constraint_id: bpy.props.StringProperty()
-    degrees: bpy.props.FloatProperty(
-        name="Angle",
-        description="Target angle in degrees",
-        min=0.0,
-        max=180.0,
-        default=90.0,
-    )
-
     def invoke(self, context, _event):
-        obj = _get_sketch_object(context)
+        if self.skip_dialog:
+            return self.execute(context)
+        obj = self._sketch_obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
-        constraints = load_constraints(obj)
-        for constraint in constraints:
-            if getattr(constraint, "id", None) == self.constraint_id and isinstance(constraint, AngleConstraint):
-                self.degrees = constraint.degrees
-                break
+        _constraints, index = load_constraints_indexed(obj)
+        constraint = index.get(self.constraint_id)
+        if isinstance(constraint, AngleConstraint):
+            self.degrees = constraint.degrees
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context):
-        obj = _get_sketch_object(context)
+        obj = _take_sketch_object(self, context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        def updater(constraint):
-            if isinstance(constraint, AngleConstraint):
-                return AngleConstraint(
-                    id=constraint.id,
-                    p1=constraint.p1,
-                    vertex=constraint.vertex,
-                    p2=constraint.p2,
-                    degrees=self.degrees,
-                )
-            return constraint
-
-        if not update_constraint(obj, self.constraint_id, updater):
-            self.report({"WARNING"}, "Constraint not found")
-            return {"CANCELLED"}
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
+            return _fail(self, _MSG_NO_SKETCH)
+
+        constraints = _edit_value(self, obj, self.constraint_id, AngleConstraint)
+        if constraints is None:
+            return _fail(self, _MSG_NOT_FOUND)
+
+        _resolve_and_refresh(context, obj, constraints, {self.constraint_id})
 
-        self.report({"INFO"}, "Angle updated")
+        self.report(_INFO, "Angle updated")
         return {"FINISHED"}
 
 
-class AIHELPER_OT_edit_radius_constraint(bpy.types.Operator):
+class AIHELPER_OT_edit_radius_constraint(
+    _ConstraintIdProps, _RadiusProps, _SkipDialogProps, bpy.types.Operator
+):
     bl_idname = "aihelper.edit_radius_constraint"
     bl_label = "Edit Radius"
     bl_description = "Edit a radius constraint value"
     bl_options = {"REGISTER", "UNDO"}
 
-    constraint_id: bpy.props.StringProperty()
-    radius: bpy.props.FloatProperty(
-        name="Radius",
-        description="Target radius",
-        min=0.0,
-        default=1.0,
-    )
-
     def invoke(self, context, _event):
-        obj = _get_sketch_object(context)
+        if self.skip_dialog:
+            return self.execute(context)
+        obj = self._sketch_obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
-        constraints = load_constraints(obj)
-        for constraint in constraints:
-            if getattr(constraint, "id", None) == self.constraint_id and isinstance(constraint, RadiusConstraint):
-                self.radius = constraint.radius
-                break
+        _constraints, index = load_constraints_indexed(obj)
+        constraint = index.get(self.constraint_id)
+        if isinstance(constraint, RadiusConstraint):
+            self.radius = constraint.radius
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context):
-        obj = _get_sketch_object(context)
+        obj = _take_sketch_object(self, context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
-
-        def updater(constraint):
-            if isinstance(constraint, RadiusConstraint):
-                update_circle_radius(obj, constraint.entity, self.radius)
-                _update_tangent_radii(obj, constraint.entity, self.radius)
-                return RadiusConstraint(
-                    id=constraint.id,
-                    entity=constraint.entity,
-                    radius=self.radius,
-                )
-            return constraint
-
-        if not update_constraint(obj, self.constraint_id, updater):
-            self.report({"WARNING"}, "Constraint not found")
-            return {"CANCELLED"}
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
+            return _fail(self, _MSG_NO_SKETCH)
 
-        self.report({"INFO"}, "Radius updated")
+        constraints = _edit_value(self, obj, self.constraint_id, RadiusConstraint)
+        if constraints is None:
+            return _fail(self, _MSG_NOT_FOUND)
+
+        _resolve_and_refresh(context, obj, constraints)
+
+        self.report(_INFO, "Radius updated")
         return {"FINISHED"}
 
 
-class AIHELPER_OT_remove_constraint(bpy.types.Operator):
+class AIHELPER_OT_remove_constraint(_ConstraintIdProps, bpy.types.Operator):
     bl_idname = "aihelper.remove_constraint"
     bl_label = "Remove Constraint"
     bl_description = "Remove a constraint"
     bl_options = {"REGISTER", "UNDO"}
 
-    constraint_id: bpy.props.StringProperty()
-
     def execute(self, context):
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
-        if not remove_constraint(obj, self.constraint_id):
-            self.report({"WARNING"}, "Constraint not found")
-            return {"CANCELLED"}
+        constraints = remove_constraint(obj, self.constraint_id)
+        if constraints is None:
+            return _fail(self, _MSG_NOT_FOUND)
 
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-        self.report({"INFO"}, "Constraint removed")
+        _resolve_and_refresh(context, obj, constraints)
+        self.report(_INFO, "Constraint removed")
         return {"FINISHED"}
 
 
-class AIHELPER_OT_edit_selected_dimension(bpy.types.Operator):
+class AIHELPER_OT_edit_selected_dimension(
+    _ConstraintIdProps, _DistanceProps, _AngleProps, _RadiusProps, _SkipDialogProps, bpy.types.Operator
+):
     bl_idname = "aihelper.edit_selected_dimension"
     bl_label = "Edit Selected Dimension"
     bl_description = "Edit the constraint value for the selected label"
     bl_options = {"REGISTER", "UNDO"}
 
-    distance: bpy.props.FloatProperty(
-        name="Distance",
-        description="Target distance",
-        min=0.0,
-        default=1.0,
-    )
-    degrees: bpy.props.FloatProperty(
-        name="Angle",
-        description="Target angle in degrees",
-        min=0.0,
-        max=180.0,
-        default=90.0,
-    )
-    radius: bpy.props.FloatProperty(
-        name="Radius",
-        description="Target radius",
-        min=0.0,
-        default=1.0,
-    )
-    constraint_id: bpy.props.StringProperty()
     kind: bpy.props.StringProperty()
 
     def draw(self, _context):
@@ -1220,99 +1231,62 @@ class AIHELPER_OT_edit_selected_dimension(bpy.types.Operator):
             layout.prop(self, "distance")
 
     def invoke(self, context, _event):
-        obj = _get_sketch_object(context)
+        if self.skip_dialog:
+            return self.execute(context)
+        obj = self._sketch_obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
         label = context.active_object
         if label is None:
-            self.report({"WARNING"}, "Select a dimension label")
-            return {"CANCELLED"}
+            return _fail(self, "Select a dimension label")
 
         constraint_id = get_dimension_constraint_id(label)
         if not constraint_id:
-            self.report({"WARNING"}, "Active object is not a dimension label")
-            return {"CANCELLED"}
+            return _fail(self, "Active object is not a dimension label")
 
         kind = get_dimension_kind(label) or "distance"
-        constraints = load_constraints(obj)
-        for constraint in constraints:
-            if getattr(constraint, "id", None) != constraint_id:
-                continue
-            if kind == "angle" and isinstance(constraint, AngleConstraint):
-                self.degrees = constraint.degrees
-                break
-            if kind == "radius" and isinstance(constraint, RadiusConstraint):
-                self.radius = constraint.radius
-                break
-            if kind == "distance" and isinstance(constraint, DistanceConstraint):
-                self.distance = constraint.distance
-                break
-        else:
-            self.report({"WARNING"}, "Constraint not found")
-            return {"CANCELLED"}
+        cls, field_name = _KIND_TO_FIELD.get(kind, (None, None))
+        _constraints, index = load_constraints_indexed(obj)
+        constraint = index.get(constraint_id)
+        if cls is None or not isinstance(constraint, cls):
+            return _fail(self, _MSG_NOT_FOUND)
 
+        setattr(self, field_name, getattr(constraint, field_name))
         self.constraint_id = constraint_id
         self.kind = kind
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context):
-        obj = _get_sketch_object(context)
+        obj = _take_sketch_object(self, context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
         constraint_id = getattr(self, "constraint_id", None)
         if not constraint_id:
-            self.report({"WARNING"}, "No constraint selected")
-            return {"CANCELLED"}
-
-        def updater(constraint):
-            if constraint.id != constraint_id:
-                return constraint
-            if self.kind == "angle" and isinstance(constraint, AngleConstraint):
-                return AngleConstraint(
-                    id=constraint.id,
-                    p1=constraint.p1,
-                    vertex=constraint.vertex,
-                    p2=constraint.p2,
-                    degrees=self.degrees,
-                )
-            if self.kind == "radius" and isinstance(constraint, RadiusConstraint):
-                update_circle_radius(obj, constraint.entity, self.radius)
-                return RadiusConstraint(
-                    id=constraint.id,
-                    entity=constraint.entity,
-                    radius=self.radius,
-                )
-            if self.kind == "distance" and isinstance(constraint, DistanceConstraint):
-                return DistanceConstraint(
-                    id=constraint.id,
-                    p1=constraint.p1,
-                    p2=constraint.p2,
-                    distance=self.distance,
-                )
-            return constraint
-
-        if not update_constraint(obj, constraint_id, updater):
-            self.report({"WARNING"}, "Constraint not found")
-            return {"CANCELLED"}
-
-        diag = solve_mesh(obj, load_constraints(obj))
-        update_dimensions(context, obj, load_constraints(obj))
-        _update_solver_report(context, diag)
-        self.report({"INFO"}, "Dimension updated")
+            return _fail(self, "No constraint selected")
+
+        cls, _field_name = _KIND_TO_FIELD.get(self.kind, (None, None))
+        if cls is None:
+            return _fail(self, _MSG_NOT_FOUND)
+
+        constraints = _edit_value(self, obj, constraint_id, cls)
+        if constraints is None:
+            return _fail(self, _MSG_NOT_FOUND)
+
+        # Radius edits move the circle samples before the solve, so refresh every label.
+        changed_ids = None if cls is RadiusConstraint else {constraint_id}
+        _resolve_and_refresh(context, obj, constraints, changed_ids)
+        self.report(_INFO, "Dimension updated")
         return {"FINISHED"}
 
 
-class AIHELPER_OT_select_constraint(bpy.types.Operator):
+class AIHELPER_OT_select_constraint(_ConstraintIdProps, bpy.types.Operator):
     bl_idname = "aihelper.select_constraint"
     bl_label = "Select Constraint"
     bl_description = "Select geometry associated with a constraint"
     bl_options = {"REGISTER", "UNDO"}
 
-    constraint_id: bpy.props.StringProperty()
     extend: bpy.props.BoolProperty(default=False, options={"HIDDEN"})
 
     def invoke(self, context, event):
@@ -1322,29 +1296,21 @@ class AIHELPER_OT_select_constraint(bpy.types.Operator):
     def execute(self, context):
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
         constraint_id = getattr(self, "constraint_id", None)
         if not constraint_id:
-            self.report({"WARNING"}, "No constraint selected")
-            return {"CANCELLED"}
+            return _fail(self, "No constraint selected")
 
-        constraints = load_constraints(obj)
-        target = None
-        for constraint in constraints:
-            if getattr(constraint, "id", None) == constraint_id:
-                target = constraint
-                break
+        _constraints, index = load_constraints_indexed(obj)
+        target = index.get(constraint_id)
         if target is None:
-            self.report({"WARNING"}, "Constraint not found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NOT_FOUND)
 
         context.view_layer.objects.active = obj
         ok, message = _select_constraint_geometry(obj, target, extend=self.extend)
         if not ok:
-            self.report({"WARNING"}, message)
-            return {"CANCELLED"}
+            return _fail(self, message)
         return {"FINISHED"}
 
 
@@ -1363,85 +1329,100 @@ class AIHELPER_OT_select_worst_constraint(bpy.types.Operator):
     def execute(self, context):
         obj = _get_sketch_object(context)
         if obj is None:
-            self.report({"WARNING"}, "No sketch mesh found")
-            return {"CANCELLED"}
+            return _fail(self, _MSG_NO_SKETCH)
 
         constraint_id = context.scene.ai_helper.last_solver_worst_id
         if not constraint_id:
-            self.report({"WARNING"}, "No solver diagnostics available")
-            return {"CANCELLED"}
+            return _fail(self, "No solver diagnostics available")
 
-        constraints = load_constraints(obj)
-        target = None
-        for constraint in constraints:
-            if getattr(constraint, "id", None) == constraint_id:
-                target = constraint
-                break
+        _constraints, index = load_constraints_indexed(obj)
+        target = index.get(constraint_id)
         if target is None:
-            self.report({"WARNING"}, "Worst constraint not found")
-            return {"CANCELLED"}
+            return _fail(self, "Worst constraint not found")
 
         context.view_layer.objects.active = obj
         ok, message = _select_constraint_geometry(obj, target, extend=self.extend)
         if not ok:
-            self.report({"WARNING"}, message)
-            return {"CANCELLED"}
+            return _fail(self, message)
         return {"FINISHED"}
 
 
+_CLASSES = (
+    AIHELPER_OT_add_distance_constraint,
+    AIHELPER_OT_add_horizontal_constraint,
+    AIHELPER_OT_add_vertical_constraint,
+    AIHELPER_OT_add_angle_constraint,
+    AIHELPER_OT_add_radius_constraint,
+    AIHELPER_OT_add_coincident_constraint,
+    AIHELPER_OT_add_midpoint_constraint,
+    AIHELPER_OT_add_equal_length_constraint,
+    AIHELPER_OT_add_concentric_constraint,
+    AIHELPER_OT_add_symmetry_constraint,
+    AIHELPER_OT_add_tangent_constraint,
+    AIHELPER_OT_add_parallel_constraint,
+    AIHELPER_OT_add_perpendicular_constraint,
+    AIHELPER_OT_add_fix_constraint,
+    AIHELPER_OT_solve_constraints,
+    AIHELPER_OT_clear_constraints,
+    AIHELPER_OT_clear_solver_report,
+    AIHELPER_OT_edit_distance_constraint,
+    AIHELPER_OT_edit_angle_constraint,
+    AIHELPER_OT_edit_radius_constraint,
+    AIHELPER_OT_remove_constraint,
+    AIHELPER_OT_update_dimensions,
+    AIHELPER_OT_clear_dimensions,
+    AIHELPER_OT_edit_selected_dimension,
+    AIHELPER_OT_select_constraint,
+    AIHELPER_OT_select_worst_constraint,
+)
+
+
+# Registered in register() so the panel's first buttons work immediately;
+# the rest follow on a timer once Blender is back in its event loop. The timer is
+# persistent so a file loaded at startup does not drop it before it fires. Scripted
+# callers that may run before it fires use ensure_registered().
+_EAGER_CLASSES = _CLASSES[:2]
+_REGISTER_DELAY = 0.01
+
+
+def _register_classes(classes):
+    register_class = bpy.utils.register_class
+    for cls in classes:
+        if getattr(cls, "is_registered", False):
+            continue
+        register_class(cls)
+
+
+def _register_deferred():
+    _register_classes(_CLASSES)
+    return None
+
+
+def ensure_registered():
+    if bpy.app.timers.is_registered(_register_deferred):
+        bpy.app.timers.unregister(_register_deferred)
+        _register_classes(_CLASSES)
+
+
 def register():
-    bpy.utils.register_class(AIHELPER_OT_add_distance_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_horizontal_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_vertical_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_angle_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_radius_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_coincident_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_midpoint_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_equal_length_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_concentric_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_symmetry_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_tangent_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_parallel_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_perpendicular_constraint)
-    bpy.utils.register_class(AIHELPER_OT_add_fix_constraint)
-    bpy.utils.register_class(AIHELPER_OT_solve_constraints)
-    bpy.utils.register_class(AIHELPER_OT_clear_constraints)
-    bpy.utils.register_class(AIHELPER_OT_clear_solver_report)
-    bpy.utils.register_class(AIHELPER_OT_edit_distance_constraint)
-    bpy.utils.register_class(AIHELPER_OT_edit_angle_constraint)
-    bpy.utils.register_class(AIHELPER_OT_edit_radius_constraint)
-    bpy.utils.register_class(AIHELPER_OT_remove_constraint)
-    bpy.utils.register_class(AIHELPER_OT_update_dimensions)
-    bpy.utils.register_class(AIHELPER_OT_clear_dimensions)
-    bpy.utils.register_class(AIHELPER_OT_edit_selected_dimension)
-    bpy.utils.register_class(AIHELPER_OT_select_constraint)
-    bpy.utils.register_class(AIHELPER_OT_select_worst_constraint)
+    wm = bpy.context.window_manager
+    if bpy.app.background or wm is None or not wm.windows:
+        # No event loop yet (batch runs, startup scripts): a timer would fire after the caller's ops.
+        _register_classes(_CLASSES)
+        return
+    _register_classes(_EAGER_CLASSES)
+    bpy.app.timers.register(_register_deferred, first_interval=_REGISTER_DELAY, persistent=True)
 
 
 def unregister():
-    bpy.utils.unregister_class(AIHELPER_OT_select_worst_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_select_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_edit_selected_dimension)
-    bpy.utils.unregister_class(AIHELPER_OT_clear_dimensions)
-    bpy.utils.unregister_class(AIHELPER_OT_update_dimensions)
-    bpy.utils.unregister_class(AIHELPER_OT_remove_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_edit_radius_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_edit_angle_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_edit_distance_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_clear_solver_report)
-    bpy.utils.unregister_class(AIHELPER_OT_clear_constraints)
-    bpy.utils.unregister_class(AIHELPER_OT_solve_constraints)
-    bpy.utils.unregister_class(AIHELPER_OT_add_fix_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_vertical_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_horizontal_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_perpendicular_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_parallel_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_midpoint_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_coincident_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_equal_length_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_concentric_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_symmetry_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_tangent_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_radius_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_angle_constraint)
-    bpy.utils.unregister_class(AIHELPER_OT_add_distance_constraint)
+    if bpy.app.timers.is_registered(_register_deferred):
+        bpy.app.timers.unregister(_register_deferred)
+    _cancel_solve()
+    unregister_class = bpy.utils.unregister_class
+    for cls in reversed(_CLASSES):
+        if not getattr(cls, "is_registered", False):
+            continue
+        try:
+            unregister_class(cls)
+        except (RuntimeError, ValueError) as exc:
+            logger.logger.warning("Skipping unregister of %s: %s", cls.__name__, exc)
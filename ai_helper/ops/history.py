@@ -1,14 +1,14 @@
 import bpy
 
 from ..sketch.dimensions import update_dimensions
-from ..sketch.history import load_history, restore_snapshot, snapshot_state
-
-
-def _get_sketch_object(context):
-    obj = context.scene.objects.get("AI_Sketch")
-    if obj is None or obj.type != "MESH":
-        return None
-    return obj
+from ..sketch.history import (
+    clear_history,
+    history_count,
+    load_history_entry,
+    restore_snapshot,
+    snapshot_state,
+)
+from ._mesh_common import get_sketch_object as _get_sketch_object
 
 
 class AIHELPER_OT_capture_snapshot(bpy.types.Operator):
@@ -29,8 +29,7 @@ class AIHELPER_OT_capture_snapshot(bpy.types.Operator):
             self.report({"WARNING"}, "No sketch mesh found")
             return {"CANCELLED"}
 
-        history = load_history(obj)
-        self.label = f"Snapshot {len(history) + 1}"
+        self.label = f"Snapshot {history_count(obj) + 1}"
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context):
@@ -58,15 +57,15 @@ class AIHELPER_OT_restore_snapshot(bpy.types.Operator):
             self.report({"WARNING"}, "No sketch mesh found")
             return {"CANCELLED"}
 
-        history = load_history(obj)
-        if not history:
-            self.report({"WARNING"}, "No history available")
-            return {"CANCELLED"}
-        if self.index < 0 or self.index >= len(history):
-            self.report({"WARNING"}, "Snapshot index out of range")
+        entry = load_history_entry(obj, self.index)
+        if entry is None:
+            if not obj.get("ai_helper_history"):
+                self.report({"WARNING"}, "No history available")
+            else:
+                self.report({"WARNING"}, "Snapshot index out of range")
             return {"CANCELLED"}
 
-        constraints = restore_snapshot(obj, history[self.index])
+        constraints = restore_snapshot(obj, entry)
         update_dimensions(context, obj, constraints)
         self.report({"INFO"}, "Snapshot restored")
         return {"FINISHED"}
@@ -84,19 +83,23 @@ class AIHELPER_OT_clear_history(bpy.types.Operator):
             self.report({"WARNING"}, "No sketch mesh found")
             return {"CANCELLED"}
 
-        if "ai_helper_history" in obj:
-            del obj["ai_helper_history"]
+        clear_history(obj)
         self.report({"INFO"}, "History cleared")
         return {"FINISHED"}
 
 
+_CLASSES = (
+    AIHELPER_OT_capture_snapshot,
+    AIHELPER_OT_restore_snapshot,
+    AIHELPER_OT_clear_history,
+)
+
+
 def register():
-    bpy.utils.register_class(AIHELPER_OT_capture_snapshot)
-    bpy.utils.register_class(AIHELPER_OT_restore_snapshot)
-    bpy.utils.register_class(AIHELPER_OT_clear_history)
+    for cls in _CLASSES:
+        bpy.utils.register_class(cls)
 
 
 def unregister():
-    bpy.utils.unregister_class(AIHELPER_OT_clear_history)
-    bpy.utils.unregister_class(AIHELPER_OT_restore_snapshot)
-    bpy.utils.unregister_class(AIHELPER_OT_capture_snapshot)
+    for cls in reversed(_CLASSES):
+        bpy.utils.unregister_class(cls)
@@ -1,14 +1,105 @@
-import json
-import subprocess
+import os
 import sys
+import threading
+from collections import deque
 
 import bpy
 
 from ..core import logger
+from ..core.jsonio import JSONDecodeError, json_dumps, json_loads
 from ..core.settings import get_prefs
-from ..llm import GrokAdapter, dispatch_tool_calls, get_tool_schema, serialize_selection
-from ..llm.presets import preset_fields, preset_params, preset_prompt, render_preset_prompt
-from ..llm.recipes import recipe_prompt
+from ..llm import GrokAdapter, ToolCall, dispatch_tool_calls, get_tool_schema, serialize_selection
+from ..llm.grok_adapter import close_adapter, shutdown as shutdown_grok
+from ..llm.presets import PRESETS, preset_fields, preset_params, preset_prompt, render_preset_prompt
+from ..llm.recipes import RECIPES, recipe_prompt
+
+_PRESET_PROMPTS = {}
+_RECIPE_PROMPTS = {}
+# Last preview's JSON text -> its tool calls as dicts, so an unedited preview applies without a re-parse.
+_PREVIEW_CACHE = {}
+# Running preview request: scene name, worker thread and its result or error.
+_PREVIEW_JOB = None
+_PREVIEW_POLL_INTERVAL = 0.1
+# (adapter settings, adapter) of the last preview; a replaced adapter's client is closed.
+_ADAPTER = None
+
+
+def _adapter_for(adapter_path, mock, model, vision_model):
+    global _ADAPTER
+    key = (adapter_path, mock, model, vision_model)
+    if _ADAPTER is not None:
+        if _ADAPTER[0] == key:
+            return _ADAPTER[1]
+        close_adapter(_ADAPTER[1])
+    adapter = GrokAdapter(adapter_path=adapter_path, mock=mock, model=model, vision_model=vision_model)
+    _ADAPTER = (key, adapter)
+    return adapter
+
+
+def _encode_tool_call(obj):
+    if isinstance(obj, ToolCall):
+        return {"name": obj.name, "arguments": obj.arguments}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _preview_error_message(exc) -> str:
+    if isinstance(exc, ModuleNotFoundError) and "aiohttp" in str(exc):
+        return f"aiohttp missing. Install via Preferences or run: {sys.executable} -m pip install aiohttp"
+    logger.logger.error("Grok preview failed: %s", exc)
+    return f"Preview failed: {exc}"
+
+
+def _store_preview(props, tool_calls) -> None:
+    raw = json_dumps({"tool_calls": tool_calls}, default=_encode_tool_call)
+    props.tool_calls_json = raw
+    _PREVIEW_CACHE.clear()
+    _PREVIEW_CACHE[raw] = [call.to_dict() if isinstance(call, ToolCall) else call for call in tool_calls]
+
+
+def _run_preview_request(job, adapter, prompt, selection, request) -> None:
+    try:
+        job["result"] = adapter.request_tool_calls(prompt, selection, **request)
+    except Exception as exc:
+        job["error"] = exc
+
+
+def _show_message(message: str, icon: str) -> None:
+    wm = bpy.context.window_manager
+    if wm is None or not wm.windows:
+        return
+
+    def draw(menu, _context):
+        menu.layout.label(text=message)
+
+    wm.popup_menu(draw, title="AI Helper", icon=icon)
+
+
+def _poll_preview():
+    global _PREVIEW_JOB
+    job = _PREVIEW_JOB
+    if job is None:
+        return None
+    if job["thread"].is_alive():
+        return _PREVIEW_POLL_INTERVAL
+    _PREVIEW_JOB = None
+
+    scene = bpy.data.scenes.get(job["scene"])
+    error = job["error"]
+    if error is not None:
+        _show_message(_preview_error_message(error), "ERROR")
+        return None
+    if scene is None:
+        return None
+
+    _store_preview(scene.ai_helper, job["result"])
+    wm = bpy.context.window_manager
+    if wm is None:
+        return None
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+    return None
 
 
 class AIHELPER_OT_preview_prompt(bpy.types.Operator):
@@ -25,8 +116,8 @@ class AIHELPER_OT_preview_prompt(bpy.types.Operator):
         image_notes = props.image_notes.strip()
         prefs = get_prefs()
         default_image_url = ""
-        if prefs and getattr(prefs, "grok_vision_image_url", None):
-            default_image_url = prefs.grok_vision_image_url.strip()
+        if prefs:
+            default_image_url = (getattr(prefs, "grok_vision_image_url", None) or "").strip()
         image_input = image_path or image_url or default_image_url
         if not prompt and not image_input:
             self.report({"WARNING"}, "Prompt and image are empty")
@@ -34,53 +125,63 @@ class AIHELPER_OT_preview_prompt(bpy.types.Operator):
         if not prompt:
             prompt = image_notes or "Generate a 2D sketch from the attached image."
 
-        adapter_path = prefs.grok_adapter_path if prefs else ""
-        use_mock = not adapter_path
-        model = prefs.grok_model if prefs and prefs.grok_model.strip() else None
-        vision_model = prefs.grok_vision_model if prefs and prefs.grok_vision_model.strip() else None
+        adapter_path = ""
+        model = None
+        vision_model = None
         upload_command = None
         upload_timeout = None
-        if prefs and prefs.grok_vision_upload_command.strip():
-            upload_command = prefs.grok_vision_upload_command.strip()
-            upload_timeout = int(prefs.grok_vision_upload_timeout or 30)
-
-        adapter = GrokAdapter(
-            adapter_path=adapter_path,
-            mock=use_mock,
-            model=model,
-            vision_model=vision_model,
-        )
-        selection = serialize_selection(context)
-        tools = get_tool_schema()
+        if prefs:
+            adapter_path = prefs.grok_adapter_path
+            grok_model = prefs.grok_model
+            model = grok_model if grok_model.strip() else None
+            grok_vision_model = prefs.grok_vision_model
+            vision_model = grok_vision_model if grok_vision_model.strip() else None
+            upload_command = prefs.grok_vision_upload_command.strip() or None
+            if upload_command:
+                upload_timeout = int(prefs.grok_vision_upload_timeout or 30)
+        use_mock = not adapter_path
 
-        try:
-            tool_calls = adapter.request_tool_calls(
-                prompt,
-                selection,
-                tools=tools,
-                use_mock=use_mock,
-                image_path=image_input or None,
-                image_notes=image_notes or None,
-                upload_command=None if use_mock else upload_command,
-                upload_timeout=upload_timeout,
-            )
-        except ModuleNotFoundError as exc:
-            if "aiohttp" in str(exc):
-                self.report(
-                    {"ERROR"},
-                    f"aiohttp missing. Install via Preferences or run: {sys.executable} -m pip install aiohttp",
-                )
+        adapter = _adapter_for(adapter_path, use_mock, model, vision_model)
+        selection = serialize_selection(context)
+        request = {
+            "tools": get_tool_schema(),
+            "use_mock": use_mock,
+            "image_path": image_input or None,
+            "image_notes": image_notes or None,
+            "upload_command": None if use_mock else upload_command,
+            "upload_timeout": upload_timeout,
+        }
+
+        if use_mock or bpy.app.background:
+            try:
+                tool_calls = adapter.request_tool_calls(prompt, selection, **request)
+            except Exception as exc:
+                if isinstance(exc, ModuleNotFoundError) and "aiohttp" not in str(exc):
+                    raise
+                self.report({"ERROR"}, _preview_error_message(exc))
                 return {"CANCELLED"}
-            raise
-        except Exception as exc:
-            logger.logger.error("Grok preview failed: %s", exc)
-            self.report({"ERROR"}, f"Preview failed: {exc}")
+            _store_preview(props, tool_calls)
+            self.report({"INFO"}, "Preview ready")
+            return {"FINISHED"}
+
+        global _PREVIEW_JOB
+        job = _PREVIEW_JOB
+        if job is not None and (job["thread"].is_alive() or bpy.app.timers.is_registered(_poll_preview)):
+            self.report({"WARNING"}, "A preview request is already running")
             return {"CANCELLED"}
 
-        payload = {"tool_calls": [call.to_dict() for call in tool_calls]}
-        props.tool_calls_json = json.dumps(payload, indent=2)
-
-        self.report({"INFO"}, "Preview ready")
+        # The Grok round trip runs on a worker thread; a timer writes the result back on the main thread.
+        job = {"scene": context.scene.name, "result": None, "error": None}
+        job["thread"] = threading.Thread(
+            target=_run_preview_request,
+            args=(job, adapter, prompt, selection, request),
+            daemon=True,
+        )
+        _PREVIEW_JOB = job
+        job["thread"].start()
+        if not bpy.app.timers.is_registered(_poll_preview):
+            bpy.app.timers.register(_poll_preview, first_interval=_PREVIEW_POLL_INTERVAL, persistent=True)
+        self.report({"INFO"}, "Preview requested")
         return {"FINISHED"}
 
 
@@ -97,13 +198,14 @@ class AIHELPER_OT_apply_tool_calls(bpy.types.Operator):
             self.report({"WARNING"}, "No preview available")
             return {"CANCELLED"}
 
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            self.report({"ERROR"}, f"Invalid JSON: {exc}")
-            return {"CANCELLED"}
-
-        tool_calls = data.get("tool_calls", [])
+        tool_calls = _PREVIEW_CACHE.get(raw)
+        if tool_calls is None:
+            try:
+                data = json_loads(raw)
+            except JSONDecodeError as exc:
+                self.report({"ERROR"}, f"Invalid JSON: {exc}")
+                return {"CANCELLED"}
+            tool_calls = data.get("tool_calls", [])
         if not tool_calls:
             self.report({"WARNING"}, "No tool calls to apply")
             return {"CANCELLED"}
@@ -133,13 +235,14 @@ class AIHELPER_OT_apply_prompt_preset(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.ai_helper
         preset_key = props.prompt_preset
-        text = preset_prompt(preset_key)
+        text = _PRESET_PROMPTS.get(preset_key) or preset_prompt(preset_key)
         if not text:
             self.report({"WARNING"}, "Preset is empty")
             return {"CANCELLED"}
 
-        if self.append and props.prompt.strip():
-            props.prompt = f"{props.prompt.rstrip()}\n{text}"
+        current = props.prompt
+        if self.append and current.strip():
+            props.prompt = "\n".join((current.rstrip(), text))
         else:
             props.prompt = text
 
@@ -162,13 +265,14 @@ class AIHELPER_OT_apply_prompt_recipe(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.ai_helper
         recipe_key = props.prompt_recipe
-        text = recipe_prompt(recipe_key)
+        text = _RECIPE_PROMPTS.get(recipe_key) or recipe_prompt(recipe_key)
         if not text:
             self.report({"WARNING"}, "Recipe is empty")
             return {"CANCELLED"}
 
-        if self.append and props.prompt.strip():
-            props.prompt = f"{props.prompt.rstrip()}\n{text}"
+        current = props.prompt
+        if self.append and current.strip():
+            props.prompt = "\n".join((current.rstrip(), text))
         else:
             props.prompt = text
 
@@ -183,6 +287,8 @@ class AIHELPER_OT_install_grok_deps(bpy.types.Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, _context):
+        import subprocess
+
         try:
             import ensurepip
 
@@ -191,14 +297,24 @@ class AIHELPER_OT_install_grok_deps(bpy.types.Operator):
             pass
 
         cmd = [sys.executable, "-m", "pip", "install", "aiohttp"]
+        env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+        tail = deque(maxlen=4)
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                env=env,
+            ) as proc:
+                for line in proc.stderr:
+                    tail.append(line)
+                returncode = proc.wait()
         except Exception as exc:
             self.report({"ERROR"}, f"Install failed: {exc}")
             return {"CANCELLED"}
 
-        if result.returncode != 0:
-            detail = (result.stderr or result.stdout or "").strip()
+        if returncode != 0:
+            detail = b"".join(tail).decode("utf-8", errors="replace").strip()
             if detail:
                 detail = detail.replace("\n", " ")[:200]
                 self.report({"ERROR"}, f"Install failed: {detail}")
@@ -241,7 +357,7 @@ class AIHELPER_OT_apply_param_preset(bpy.types.Operator):
     bolt_hole_radius: bpy.props.FloatProperty(name="Bolt Hole Radius", default=3.0, min=0.0)
 
     def invoke(self, context, _event):
-        self._sync_preset_key(context)
+        self._sync_preset_key(context.scene.ai_helper)
         defaults = preset_params(self.preset_key)
         for key, value in defaults.items():
             if hasattr(self, key):
@@ -254,12 +370,14 @@ class AIHELPER_OT_apply_param_preset(bpy.types.Operator):
         if not fields:
             layout.label(text="Preset has no parameters")
             return
+        prop = layout.prop
         for key, label, _default in fields:
             if hasattr(self, key):
-                layout.prop(self, key, text=label)
+                prop(self, key, text=label)
 
     def execute(self, context):
-        self._sync_preset_key(context)
+        props = context.scene.ai_helper
+        self._sync_preset_key(props)
         fields = preset_fields(self.preset_key)
         values = {}
         for key, _label, _default in fields:
@@ -270,33 +388,45 @@ class AIHELPER_OT_apply_param_preset(bpy.types.Operator):
             self.report({"WARNING"}, "Preset is empty")
             return {"CANCELLED"}
 
-        props = context.scene.ai_helper
-        if self.append and props.prompt.strip():
-            props.prompt = f"{props.prompt.rstrip()}\n{text}"
+        current = props.prompt
+        if self.append and current.strip():
+            props.prompt = "\n".join((current.rstrip(), text))
         else:
             props.prompt = text
         self.report({"INFO"}, "Preset applied")
         return {"FINISHED"}
 
-    def _sync_preset_key(self, context):
+    def _sync_preset_key(self, props):
         if not self.preset_key:
-            props = context.scene.ai_helper
             self.preset_key = props.prompt_preset
 
 
+_CLASSES = (
+    AIHELPER_OT_preview_prompt,
+    AIHELPER_OT_apply_tool_calls,
+    AIHELPER_OT_apply_prompt_preset,
+    AIHELPER_OT_apply_prompt_recipe,
+    AIHELPER_OT_install_grok_deps,
+    AIHELPER_OT_apply_param_preset,
+)
+
+
 def register():
-    bpy.utils.register_class(AIHELPER_OT_preview_prompt)
-    bpy.utils.register_class(AIHELPER_OT_apply_tool_calls)
-    bpy.utils.register_class(AIHELPER_OT_apply_prompt_preset)
-    bpy.utils.register_class(AIHELPER_OT_apply_prompt_recipe)
-    bpy.utils.register_class(AIHELPER_OT_install_grok_deps)
-    bpy.utils.register_class(AIHELPER_OT_apply_param_preset)
+    _PRESET_PROMPTS.update((key, preset_prompt(key)) for key in PRESETS)
+    _RECIPE_PROMPTS.update((key, recipe_prompt(key)) for key in RECIPES)
+    for cls in _CLASSES:
+        bpy.utils.register_class(cls)
 
 
 def unregister():
-    bpy.utils.unregister_class(AIHELPER_OT_apply_param_preset)
-    bpy.utils.unregister_class(AIHELPER_OT_install_grok_deps)
-    bpy.utils.unregister_class(AIHELPER_OT_apply_prompt_recipe)
-    bpy.utils.unregister_class(AIHELPER_OT_apply_prompt_preset)
-    bpy.utils.unregister_class(AIHELPER_OT_apply_tool_calls)
-    bpy.utils.unregister_class(AIHELPER_OT_preview_prompt)
+    global _ADAPTER, _PREVIEW_JOB
+    if bpy.app.timers.is_registered(_poll_preview):
+        bpy.app.timers.unregister(_poll_preview)
+    _PREVIEW_JOB = None
+    shutdown_grok()
+    _ADAPTER = None
+    _PRESET_PROMPTS.clear()
+    _PREVIEW_CACHE.clear()
+    _RECIPE_PROMPTS.clear()
+    for cls in reversed(_CLASSES):
+        bpy.utils.unregister_class(cls)
@@ -1,20 +1,31 @@
+import hashlib
 import math
 
 import bpy
-import bmesh
 from mathutils import Matrix, Vector
 
+from ..core.jit import HAVE_JIT
+from ..sketch.graph import edge_components, has_path_end, is_closed_loop, ordered_path, warm_kernels
 from ..sketch.tags import resolve_tags
+from ._mesh_common import get_sketch_object as _get_sketch_object
 
 _SHELL_MOD = "AI_Shell"
 _BEVEL_MOD = "AI_Bevel"
+_MOD_SIG_KEY = "ai_helper_mod_sig"
+_SRC_SIG_KEY = "ai_helper_src_sig"
+# Keys left out of the rebuild signature; modifier settings are checked separately.
+_SIG_SKIP_KEYS = frozenset(
+    (
+        _MOD_SIG_KEY,
+        _SRC_SIG_KEY,
+        "ai_helper_shell_thickness",
+        "ai_helper_bevel_width",
+        "ai_helper_bevel_segments",
+    )
+)
 
-
-def _get_sketch_object(context):
-    obj = context.scene.objects.get("AI_Sketch")
-    if obj is None or obj.type != "MESH":
-        return None
-    return obj
+# Op object names per source, keyed by scene pointer. Ops add themselves; deleted names are pruned on lookup.
+_OP_INDEX = {}
 
 
 def _new_result_object(context, name_base: str, source):
@@ -27,26 +38,31 @@ def _new_result_object(context, name_base: str, source):
 
 def _replace_mesh(obj, new_mesh):
     old_mesh = obj.data
+    if old_mesh == new_mesh:
+        return
     obj.data = new_mesh
     if old_mesh.users == 0:
         bpy.data.meshes.remove(old_mesh)
 
 
-def _remove_modifier(obj, name: str) -> None:
-    mod = obj.modifiers.get(name)
+def _remove_modifier(obj, name: str, mod=None) -> None:
+    if mod is None:
+        mod = obj.modifiers.get(name)
     if mod is not None:
         obj.modifiers.remove(mod)
 
 
-def _ensure_shell_modifier(obj, thickness: float) -> None:
-    mod = obj.modifiers.get(_SHELL_MOD)
+def _ensure_shell_modifier(obj, thickness: float, mod=None) -> None:
+    if mod is None:
+        mod = obj.modifiers.get(_SHELL_MOD)
     if mod is None:
         mod = obj.modifiers.new(name=_SHELL_MOD, type="SOLIDIFY")
     mod.thickness = thickness
 
 
-def _ensure_bevel_modifier(obj, width: float, segments: int) -> None:
-    mod = obj.modifiers.get(_BEVEL_MOD)
+def _ensure_bevel_modifier(obj, width: float, segments: int, mod=None) -> None:
+    if mod is None:
+        mod = obj.modifiers.get(_BEVEL_MOD)
     if mod is None:
         mod = obj.modifiers.new(name=_BEVEL_MOD, type="BEVEL")
     mod.width = width
@@ -54,20 +70,66 @@ def _ensure_bevel_modifier(obj, width: float, segments: int) -> None:
     mod.limit_method = "NONE"
 
 
-def _apply_optional_modifiers(obj) -> None:
-    thickness = obj.get("ai_helper_shell_thickness")
-    if thickness is None or float(thickness) <= 0.0:
-        _remove_modifier(obj, _SHELL_MOD)
+def _apply_optional_modifiers(obj, props=None) -> None:
+    if props is None:
+        props = obj
+    thickness = float(props.get("ai_helper_shell_thickness") or 0.0)
+    width = float(props.get("ai_helper_bevel_width") or 0.0)
+    segments = props.get("ai_helper_bevel_segments")
+    segs = max(int(segments) if segments is not None else 2, 1)
+    sig = f"{thickness!r}:{width!r}:{segs}"
+    mods = {mod.name: mod for mod in obj.modifiers}
+    shell = mods.get(_SHELL_MOD)
+    bevel = mods.get(_BEVEL_MOD)
+    if (
+        props.get(_MOD_SIG_KEY) == sig
+        and (thickness > 0.0) == (shell is not None)
+        and (width > 0.0) == (bevel is not None)
+    ):
+        return
+
+    if thickness <= 0.0:
+        if shell is not None:
+            _remove_modifier(obj, _SHELL_MOD, shell)
     else:
-        _ensure_shell_modifier(obj, float(thickness))
+        _ensure_shell_modifier(obj, thickness, shell)
 
-    width = obj.get("ai_helper_bevel_width")
-    segments = obj.get("ai_helper_bevel_segments")
-    if width is None or float(width) <= 0.0:
-        _remove_modifier(obj, _BEVEL_MOD)
+    if width <= 0.0:
+        if bevel is not None:
+            _remove_modifier(obj, _BEVEL_MOD, bevel)
     else:
-        segs = int(segments) if segments is not None else 2
-        _ensure_bevel_modifier(obj, float(width), max(segs, 1))
+        _ensure_bevel_modifier(obj, width, segs, bevel)
+    obj[_MOD_SIG_KEY] = sig
+
+
+def _sig_value(value):
+    to_list = getattr(value, "to_list", None)
+    if to_list is not None:
+        return to_list()
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_sig_value(item) for item in value]
+    return value
+
+
+def _source_signature(source, arrays) -> str:
+    coords, edges = arrays
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(coords.tobytes())
+    digest.update(edges.tobytes())
+    digest.update(str(len(source.data.polygons)).encode())
+    return digest.hexdigest()
+
+
+def _op_signature(source_sig: str, props) -> str:
+    params = sorted(
+        (key, _sig_value(value)) for key, value in props.items() if key not in _SIG_SKIP_KEYS
+    )
+    digest = hashlib.blake2b(source_sig.encode(), digest_size=16)
+    digest.update(repr(params).encode())
+    return digest.hexdigest()
 
 
 def _get_active_op_object(context):
@@ -79,22 +141,128 @@ def _get_active_op_object(context):
     return obj
 
 
-def _extrude_mesh_from_source(source, distance: float, edge_indices=None):
+def _source_arrays(source):
+    return _vertex_coords(source), _edges_array(source)
+
+
+def _extrude_wire_arrays(coords, edges, distance: float, edge_indices=None):
+    import numpy as np
+
+    vert_count = len(coords)
+    edge_count = len(edges)
+    selected = edges
+    if edge_indices:
+        ids = np.unique(np.asarray(list(edge_indices), dtype=np.int64))
+        selected = edges[ids[(ids >= 0) & (ids < edge_count)]]
+    if not len(selected):
+        return None
+
+    # Same layout as bmesh extrude_edge_only on wire edges: one raised copy per used vertex,
+    # top and side edges, and a (v1, v2, v2', v1') quad per edge.
+    used, inverse = np.unique(selected, return_inverse=True)
+    top = inverse.reshape(-1, 2) + vert_count
+    raised = np.arange(vert_count, vert_count + len(used), dtype=np.int32)
+    out_coords = np.concatenate([coords, coords[used] + np.array((0.0, 0.0, distance), dtype=np.float32)])
+    out_edges = np.concatenate([edges, top, np.stack([used, raised], axis=1)]).astype(np.int32)
+    loops = np.stack([selected[:, 0], selected[:, 1], top[:, 1], top[:, 0]], axis=1).astype(np.int32)
+    return out_coords, out_edges, loops
+
+
+def _wire_extrude_mesh(arrays):
+    import numpy as np
+
+    out_coords, out_edges, loops = arrays
+    face_count = len(loops)
     mesh = bpy.data.meshes.new("AI_Extrude")
-    bm = bmesh.new()
-    bm.from_mesh(source.data)
+    mesh.vertices.add(len(out_coords))
+    mesh.vertices.foreach_set("co", out_coords.ravel())
+    mesh.edges.add(len(out_edges))
+    mesh.edges.foreach_set("vertices", out_edges.ravel())
+    mesh.loops.add(face_count * 4)
+    mesh.loops.foreach_set("vertex_index", loops.ravel())
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, face_count * 4, 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _extrude_wire_mesh(source, distance: float, edge_indices=None):
+    coords, edges = _source_arrays(source)
+    arrays = _extrude_wire_arrays(coords, edges, distance, edge_indices)
+    if arrays is None:
+        return None
+    return _wire_extrude_mesh(arrays)
+
+
+def _finish_wire_extrudes(jobs) -> int:
+    rebuilt = 0
+    for obj, props, op_sig, *args in jobs:
+        arrays = _extrude_wire_arrays(*args)
+        if arrays is None:
+            continue
+        _replace_mesh(obj, _wire_extrude_mesh(arrays))
+        _apply_optional_modifiers(obj, props)
+        obj[_SRC_SIG_KEY] = op_sig
+        rebuilt += 1
+    return rebuilt
+
+
+def _valid_bm_edges(bm, indices):
+    import numpy as np
+
+    ids = np.unique(np.asarray(list(indices), dtype=np.int64))
+    edges = bm.edges
+    ids = ids[(ids >= 0) & (ids < len(edges))]
+    edges.ensure_lookup_table()
+    return [edges[i] for i in ids.tolist()]
+
+
+def _revolve_source_mesh(source, name: str, arrays=None):
+    src = source.data
+    if src.polygons:
+        return src.copy()
+
+    # The screw modifier only reads vertices and edges, so skip copying the other layers.
+    coords, edges = arrays if arrays is not None else _source_arrays(source)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.edges.add(len(edges))
+    mesh.edges.foreach_set("vertices", edges.ravel())
+    mesh.update()
+    return mesh
+
+
+def _extrude_mesh_from_source(source, distance: float, edge_indices=None, source_bms=None):
+    import bmesh
+
+    if not source.data.polygons:
+        return _extrude_wire_mesh(source, distance, edge_indices=edge_indices)
+
+    mesh = bpy.data.meshes.new("AI_Extrude")
+    if source_bms is None:
+        bm = bmesh.new()
+        bm.from_mesh(source.data)
+    else:
+        # Parse each source once per rebuild and extrude into a copy.
+        cached = source_bms.get(source.name)
+        if cached is None:
+            cached = bmesh.new()
+            cached.from_mesh(source.data)
+            source_bms[source.name] = cached
+        bm = cached.copy()
 
-    bm.edges.ensure_lookup_table()
     edges = bm.edges
     if edge_indices:
-        edges = [bm.edges[i] for i in edge_indices if 0 <= i < len(bm.edges)]
+        edges = _valid_bm_edges(bm, edge_indices)
 
     if not edges:
         bm.free()
         return None
 
     res = bmesh.ops.extrude_edge_only(bm, edges=edges)
-    extruded = [elem for elem in res["geom"] if isinstance(elem, bmesh.types.BMVert)]
+    bm_vert = bmesh.types.BMVert
+    extruded = [elem for elem in res["geom"] if type(elem) is bm_vert]
     bmesh.ops.translate(bm, verts=extruded, vec=(0.0, 0.0, distance))
 
     bm.to_mesh(mesh)
@@ -103,91 +271,76 @@ def _extrude_mesh_from_source(source, distance: float, edge_indices=None):
     return mesh
 
 
-def _edge_components(source, edge_indices):
-    edges = []
-    for eid in edge_indices:
-        if 0 <= eid < len(source.data.edges):
-            edge = source.data.edges[eid]
-            edges.append((eid, edge.vertices[0], edge.vertices[1]))
-    if not edges:
-        return []
-
-    vert_to_edges = {}
-    for eid, v1, v2 in edges:
-        vert_to_edges.setdefault(v1, set()).add(eid)
-        vert_to_edges.setdefault(v2, set()).add(eid)
-
-    edge_lookup = {eid: (v1, v2) for eid, v1, v2 in edges}
-    remaining = set(edge_lookup.keys())
-    components = []
-    while remaining:
-        start = next(iter(remaining))
-        stack = [start]
-        component = set()
-        while stack:
-            current = stack.pop()
-            if current not in remaining:
-                continue
-            remaining.remove(current)
-            component.add(current)
-            v1, v2 = edge_lookup[current]
-            for v in (v1, v2):
-                for neighbor in vert_to_edges.get(v, set()):
-                    if neighbor in remaining:
-                        stack.append(neighbor)
-        components.append(sorted(component))
-    return components
-
-
-def _ordered_vertices_from_edges(source, edge_indices):
-    adjacency = {}
-    for eid in edge_indices:
-        if eid < 0 or eid >= len(source.data.edges):
-            continue
-        edge = source.data.edges[eid]
-        v1, v2 = edge.vertices
-        adjacency.setdefault(v1, []).append(v2)
-        adjacency.setdefault(v2, []).append(v1)
-
-    if not adjacency:
-        return None, None
-
-    deg1 = [v for v, neighbors in adjacency.items() if len(neighbors) == 1]
-    closed = False
-    if deg1:
-        start = min(deg1)
-    else:
-        if any(len(neighbors) != 2 for neighbors in adjacency.values()):
-            return None, None
-        closed = True
-        start = min(adjacency.keys())
-
-    order = [start]
-    prev = None
-    curr = start
-    while True:
-        neighbors = adjacency.get(curr, [])
-        next_candidates = [n for n in neighbors if n != prev]
-        if not next_candidates:
-            break
-        next_v = min(next_candidates)
-        if closed and next_v == start:
-            break
-        if next_v in order:
-            break
-        order.append(next_v)
-        prev, curr = curr, next_v
-        if len(order) > len(adjacency):
-            break
-
-    if len(order) != len(adjacency):
-        return None, None
-    return order, closed
-
-
-def _loft_mesh_from_source(source, edges_a, edges_b, offset_z):
-    order_a, closed_a = _ordered_vertices_from_edges(source, edges_a)
-    order_b, closed_b = _ordered_vertices_from_edges(source, edges_b)
+def _quad_mesh(name: str, coords, loops):
+    import numpy as np
+
+    face_count = len(loops) // 4
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set("vertex_index", loops)
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, face_count * 4, 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _vertex_coords(source):
+    import numpy as np
+
+    vertices = source.data.vertices
+    coords = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+
+def _selected_edge_indices(source):
+    import numpy as np
+
+    edges = source.data.edges
+    selected = np.zeros(len(edges), dtype=bool)
+    edges.foreach_get("select", selected)
+    indices = np.flatnonzero(selected).tolist()
+    return indices or None
+
+
+def _edges_array(source):
+    import numpy as np
+
+    edges = source.data.edges
+    arr = np.empty(len(edges) * 2, dtype=np.int32)
+    edges.foreach_get("vertices", arr)
+    return arr.reshape(-1, 2)
+
+
+def _edge_rows(edge_indices, edge_array):
+    import numpy as np
+
+    ids = np.asarray(list(edge_indices), dtype=np.int64)
+    ids = ids[(ids >= 0) & (ids < len(edge_array))]
+    return ids, edge_array[ids]
+
+
+def _edge_components(source, edge_indices, edge_array=None):
+    if edge_array is None:
+        edge_array = _edges_array(source)
+    ids, rows = _edge_rows(edge_indices, edge_array)
+    return edge_components(ids, rows)
+
+
+def _ordered_vertices_from_edges(source, edge_indices, edge_array=None):
+    if edge_array is None:
+        edge_array = _edges_array(source)
+    return ordered_path(_edge_rows(edge_indices, edge_array)[1])
+
+
+def _loft_mesh_from_source(source, edges_a, edges_b, offset_z, arrays=None):
+    import numpy as np
+
+    coords, edge_array = arrays if arrays is not None else _source_arrays(source)
+    order_a, closed_a = _ordered_vertices_from_edges(source, edges_a, edge_array)
+    order_b, closed_b = _ordered_vertices_from_edges(source, edges_b, edge_array)
     if not order_a or not order_b:
         return None
     if len(order_a) != len(order_b):
@@ -195,35 +348,18 @@ def _loft_mesh_from_source(source, edges_a, edges_b, offset_z):
     if closed_a != closed_b:
         return None
 
-    coords_a = [source.data.vertices[i].co.copy() for i in order_a]
-    coords_b = [source.data.vertices[i].co.copy() for i in order_b]
-    avg_z_a = sum(coord.z for coord in coords_a) / len(coords_a)
-    avg_z_b = sum(coord.z for coord in coords_b) / len(coords_b)
+    coords_a = coords[order_a]
+    coords_b = coords[order_b]
+    avg_z_a = float(coords_a[:, 2].mean(dtype=np.float64))
+    avg_z_b = float(coords_b[:, 2].mean(dtype=np.float64))
     if abs(avg_z_a - avg_z_b) < 1e-6 and abs(offset_z) > 1e-6:
-        coords_b = [Vector((c.x, c.y, c.z + offset_z)) for c in coords_b]
-
-    mesh = bpy.data.meshes.new("AI_Loft")
-    bm = bmesh.new()
-    verts_a = [bm.verts.new(coord) for coord in coords_a]
-    verts_b = [bm.verts.new(coord) for coord in coords_b]
-    bm.verts.ensure_lookup_table()
-
-    count = len(verts_a)
-    if closed_a:
-        pairs = [(i, (i + 1) % count) for i in range(count)]
-    else:
-        pairs = [(i, i + 1) for i in range(count - 1)]
-
-    for i, j in pairs:
-        try:
-            bm.faces.new((verts_a[i], verts_a[j], verts_b[j], verts_b[i]))
-        except ValueError:
-            pass
+        coords_b[:, 2] += offset_z
 
-    bm.to_mesh(mesh)
-    bm.free()
-    mesh.update()
-    return mesh
+    count = len(order_a)
+    i = np.arange(count if closed_a else count - 1, dtype=np.int32)
+    j = (i + 1) % count
+    loops = np.stack([i, j, j + count, i + count], axis=1).ravel()
+    return _quad_mesh("AI_Loft", np.concatenate([coords_a, coords_b]), loops)
 
 
 def _align_profile_coords(prev_coords, coords, closed):
@@ -260,14 +396,17 @@ def _align_profile_coords(prev_coords, coords, closed):
     return best
 
 
-def _loft_mesh_from_sections(source, sections, offset_z):
+def _loft_mesh_from_sections(source, sections, offset_z, arrays=None):
+    import numpy as np
+
     if len(sections) < 2:
         return None
 
+    coords_table, edge_array = arrays if arrays is not None else _source_arrays(source)
     profile_orders = []
     closed_flags = []
     for edges in sections:
-        order, closed = _ordered_vertices_from_edges(source, edges)
+        order, closed = _ordered_vertices_from_edges(source, edges, edge_array)
         if not order:
             return None
         profile_orders.append(order)
@@ -282,7 +421,7 @@ def _loft_mesh_from_sections(source, sections, offset_z):
 
     profile_coords = []
     for order in profile_orders:
-        profile_coords.append([source.data.vertices[i].co.copy() for i in order])
+        profile_coords.append([Vector(row) for row in coords_table[order].tolist()])
 
     avg_zs = [sum(coord.z for coord in coords) / len(coords) for coords in profile_coords]
     if avg_zs:
@@ -297,51 +436,45 @@ def _loft_mesh_from_sections(source, sections, offset_z):
     for coords in profile_coords[1:]:
         aligned_coords.append(_align_profile_coords(aligned_coords[-1], coords, closed))
 
-    mesh = bpy.data.meshes.new("AI_Loft")
-    bm = bmesh.new()
-    sections_bm = []
-    for coords in aligned_coords:
-        section = [bm.verts.new(coord) for coord in coords]
-        sections_bm.append(section)
-    bm.verts.ensure_lookup_table()
-
-    count = len(sections_bm[0])
-    for idx in range(len(sections_bm) - 1):
-        a_section = sections_bm[idx]
-        b_section = sections_bm[idx + 1]
-        for j in range(count if closed else count - 1):
-            k = (j + 1) % count
-            try:
-                bm.faces.new((a_section[j], a_section[k], b_section[k], b_section[j]))
-            except ValueError:
-                pass
-
-    bm.to_mesh(mesh)
-    bm.free()
-    mesh.update()
-    return mesh
-
-
-def _path_vertices_from_edges(source, edge_indices):
-    order, closed = _ordered_vertices_from_edges(source, edge_indices)
+    # Profiles are distinct vertices and a closed profile has at least three, so every quad is valid.
+    count = len(aligned_coords[0])
+    i = np.arange(count if closed else count - 1, dtype=np.int32)
+    j = (i + 1) % count
+    starts = (np.arange(len(aligned_coords) - 1, dtype=np.int32) * count)[:, None]
+    loops = np.stack([starts + i, starts + j, starts + count + j, starts + count + i], axis=2).ravel()
+    coords = np.array([tuple(coord) for section in aligned_coords for coord in section], dtype=np.float32)
+    return _quad_mesh("AI_Loft", coords, loops)
+
+
+def _path_vertices_from_edges(source, edge_indices, edge_array=None):
+    if edge_array is None:
+        edge_array = _edges_array(source)
+    rows = _edge_rows(edge_indices, edge_array)[1]
+    # Without a degree-1 end the walk can only report a loop or fail, so skip it.
+    if not len(rows) or not has_path_end(rows):
+        return None
+    order, closed = ordered_path(rows)
     if not order or closed:
         return None
     return order
 
 
-def _sweep_mesh_from_source(source, profile_edges, path_edges, twist_deg=0.0):
-    profile_order, profile_closed = _ordered_vertices_from_edges(source, profile_edges)
+def _sweep_mesh_from_source(source, profile_edges, path_edges, twist_deg=0.0, arrays=None):
+    import bmesh
+
+    coords_table, edge_array = arrays if arrays is not None else _source_arrays(source)
+    profile_order, profile_closed = _ordered_vertices_from_edges(source, profile_edges, edge_array)
     if not profile_order:
         return None
 
-    path_order = _path_vertices_from_edges(source, path_edges)
+    path_order = _path_vertices_from_edges(source, path_edges, edge_array)
     if not path_order or len(path_order) < 2:
         return None
 
-    profile_coords = [source.data.vertices[i].co.copy() for i in profile_order]
+    profile_coords = [Vector(row) for row in coords_table[profile_order].tolist()]
     center = sum((coord for coord in profile_coords), Vector()) / len(profile_coords)
     local_coords = [coord - center for coord in profile_coords]
-    path_coords = [source.data.vertices[i].co.copy() for i in path_order]
+    path_coords = [Vector(row) for row in coords_table[path_order].tolist()]
 
     up = Vector((0.0, 0.0, 1.0))
     twist_total = math.radians(twist_deg)
@@ -349,6 +482,7 @@ def _sweep_mesh_from_source(source, profile_edges, path_edges, twist_deg=0.0):
 
     mesh = bpy.data.meshes.new("AI_Sweep")
     bm = bmesh.new()
+    new_vert = bm.verts.new
     sections = []
 
     for idx, pos in enumerate(path_coords):
@@ -376,19 +510,16 @@ def _sweep_mesh_from_source(source, profile_edges, path_edges, twist_deg=0.0):
             normal = rot @ normal
             binormal = rot @ binormal
 
-        section = []
-        for coord in local_coords:
-            offset = normal * coord.x + binormal * coord.y
-            section.append(bm.verts.new(pos + offset))
-        sections.append(section)
+        sections.append([new_vert(pos + normal * coord.x + binormal * coord.y) for coord in local_coords])
 
-    bm.verts.ensure_lookup_table()
     count = len(local_coords)
-    for idx in range(len(sections) - 1):
-        for j in range(count if profile_closed else count - 1):
+    span = count if profile_closed else count - 1
+    new_face = bm.faces.new
+    for a_section, b_section in zip(sections, sections[1:]):
+        for j in range(span):
             k = (j + 1) % count
             try:
-                bm.faces.new((sections[idx][j], sections[idx][k], sections[idx + 1][k], sections[idx + 1][j]))
+                new_face((a_section[j], a_section[k], b_section[k], b_section[j]))
             except ValueError:
                 pass
 
@@ -423,9 +554,7 @@ class AIHELPER_OT_extrude_sketch(bpy.types.Operator):
 
         edge_indices = None
         if self.use_selection:
-            edge_indices = [e.index for e in source.data.edges if e.select]
-            if not edge_indices:
-                edge_indices = None
+            edge_indices = _selected_edge_indices(source)
 
         mesh = _extrude_mesh_from_source(source, self.distance, edge_indices=edge_indices)
         if mesh is None:
@@ -435,6 +564,7 @@ class AIHELPER_OT_extrude_sketch(bpy.types.Operator):
         obj = _new_result_object(context, "AI_Extrude", source)
         obj.data = mesh
         obj["ai_helper_op"] = "extrude"
+        index_op_object(context.scene, obj)
         obj["ai_helper_extrude_distance"] = self.distance
         if edge_indices:
             obj["ai_helper_extrude_edges"] = list(edge_indices)
@@ -472,8 +602,9 @@ class AIHELPER_OT_revolve_sketch(bpy.types.Operator):
             return {"CANCELLED"}
 
         obj = _new_result_object(context, "AI_Revolve", source)
-        obj.data = source.data.copy()
+        _replace_mesh(obj, _revolve_source_mesh(source, "AI_Revolve_mesh"))
         obj["ai_helper_op"] = "revolve"
+        index_op_object(context.scene, obj)
         obj["ai_helper_revolve_angle"] = self.angle
         obj["ai_helper_revolve_steps"] = self.steps
 
@@ -540,7 +671,7 @@ class AIHELPER_OT_loft_profiles(bpy.types.Operator):
             _, edges_b = resolve_tags(source, [tag_b], prefer_center=False)
             sections = [sorted(set(edges_a)), sorted(set(edges_b))]
         else:
-            selected = [e.index for e in source.data.edges if e.select]
+            selected = _selected_edge_indices(source) or []
             components = _edge_components(source, selected)
             if len(components) >= 2:
                 sections = [sorted(set(component)) for component in components]
@@ -560,6 +691,7 @@ class AIHELPER_OT_loft_profiles(bpy.types.Operator):
         obj = _new_result_object(context, "AI_Loft", source)
         obj.data = mesh
         obj["ai_helper_op"] = "loft"
+        index_op_object(context.scene, obj)
         obj["ai_helper_loft_sections"] = [list(section) for section in sections]
         obj["ai_helper_loft_offset_z"] = float(self.offset_z)
         _apply_optional_modifiers(obj)
@@ -606,11 +738,11 @@ class AIHELPER_OT_sweep_profile(bpy.types.Operator):
             profile_edges = sorted(set(profile_edges))
             path_edges = sorted(set(path_edges))
         else:
-            selected = [e.index for e in source.data.edges if e.select]
-            components = _edge_components(source, selected)
+            selected = _selected_edge_indices(source) or []
+            edge_array = _edges_array(source)
+            components = _edge_components(source, selected, edge_array)
             for component in components:
-                _, closed = _ordered_vertices_from_edges(source, component)
-                if closed:
+                if is_closed_loop(_edge_rows(component, edge_array)[1]):
                     profile_edges = component
                 else:
                     path_edges = component
@@ -627,6 +759,7 @@ class AIHELPER_OT_sweep_profile(bpy.types.Operator):
         obj = _new_result_object(context, "AI_Sweep", source)
         obj.data = mesh
         obj["ai_helper_op"] = "sweep"
+        index_op_object(context.scene, obj)
         obj["ai_helper_sweep_profile_edges"] = list(profile_edges)
         obj["ai_helper_sweep_path_edges"] = list(path_edges)
         obj["ai_helper_sweep_twist_deg"] = float(self.twist_deg)
@@ -643,80 +776,183 @@ class AIHELPER_OT_rebuild_3d_ops(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
-        rebuilt = rebuild_ops(context.scene)
+        rebuilt = rebuild_ops(context.scene, force=True)
         self.report({"INFO"}, f"Rebuilt {rebuilt} objects")
         return {"FINISHED"}
 
 
-def has_ops(scene, source_name: str | None = None) -> bool:
-    for obj in scene.objects:
-        if obj.get("ai_helper_op") and obj.get("ai_helper_source"):
-            if source_name is None or obj.get("ai_helper_source") == source_name:
-                return True
-    return False
+def invalidate_op_index() -> None:
+    _OP_INDEX.clear()
 
 
-def rebuild_ops(scene):
-    rebuilt = 0
+def _op_index(scene):
+    key = scene.as_pointer()
+    index = _OP_INDEX.get(key)
+    if index is not None:
+        return index
+
+    index = {}
     for obj in scene.objects:
-        op = obj.get("ai_helper_op")
-        source_name = obj.get("ai_helper_source")
-        if not op or not source_name:
+        if "ai_helper_op" not in obj or not obj["ai_helper_op"]:
             continue
+        source_name = obj.get("ai_helper_source")
+        if source_name:
+            index.setdefault(source_name, set()).add(obj.name)
+    _OP_INDEX[key] = index
+    return index
+
+
+def index_op_object(scene, obj) -> None:
+    index = _OP_INDEX.get(scene.as_pointer())
+    if index is None:
+        return
+    if "ai_helper_op" not in obj or not obj["ai_helper_op"]:
+        return
+    source_name = obj.get("ai_helper_source")
+    if source_name:
+        index.setdefault(source_name, set()).add(obj.name)
+
+
+def index_op_updates(scene, depsgraph) -> None:
+    if scene.as_pointer() not in _OP_INDEX:
+        return
+    for update in depsgraph.updates:
+        obj = getattr(update, "id", None)
+        if isinstance(obj, bpy.types.Object):
+            index_op_object(scene, getattr(obj, "original", obj))
+
+
+def _live_ops(scene, index, source_name) -> bool:
+    names = index.get(source_name)
+    if not names:
+        index.pop(source_name, None)
+        return False
+    objects = scene.objects
+    for name in list(names):
+        obj = objects.get(name)
+        if obj is None or not obj.get("ai_helper_op") or obj.get("ai_helper_source") != source_name:
+            names.discard(name)
+    if not names:
+        del index[source_name]
+        return False
+    return True
 
-        source = scene.objects.get(source_name)
-        if source is None:
-            continue
 
-        if op == "extrude":
-            distance = float(obj.get("ai_helper_extrude_distance", 1.0))
-            edge_indices = obj.get("ai_helper_extrude_edges")
-            mesh = _extrude_mesh_from_source(source, distance, edge_indices=edge_indices)
-            if mesh is None:
+def has_ops(scene, source_name: str | None = None) -> bool:
+    index = _op_index(scene)
+    if source_name is not None:
+        return _live_ops(scene, index, source_name)
+    return any(_live_ops(scene, index, name) for name in list(index))
+
+
+def rebuild_ops(scene, force: bool = False):
+    rebuilt = 0
+    source_bms = {}
+    source_sigs = {}
+    source_arrays = {}
+    wire_jobs = []
+    try:
+        objects = scene.objects
+        for obj in objects:
+            if "ai_helper_op" not in obj:
                 continue
-            _replace_mesh(obj, mesh)
-            _apply_optional_modifiers(obj)
-            rebuilt += 1
-        elif op == "revolve":
-            angle = float(obj.get("ai_helper_revolve_angle", 360.0))
-            steps = int(obj.get("ai_helper_revolve_steps", 32))
-            new_mesh = source.data.copy()
-            _replace_mesh(obj, new_mesh)
-            mod = obj.modifiers.get("AI_Revolve")
-            if mod is None:
-                mod = obj.modifiers.new(name="AI_Revolve", type="SCREW")
-                mod.axis = "Z"
-                mod.use_merge_vertices = True
-                mod.merge_threshold = 0.001
-            mod.angle = math.radians(angle)
-            mod.steps = steps
-            _apply_optional_modifiers(obj)
-            rebuilt += 1
-        elif op == "loft":
-            sections = obj.get("ai_helper_loft_sections")
-            offset_z = float(obj.get("ai_helper_loft_offset_z", 0.0))
-            if isinstance(sections, list) and len(sections) >= 2:
-                mesh = _loft_mesh_from_sections(source, sections, offset_z)
-            else:
-                edges_a = obj.get("ai_helper_loft_edges_a") or []
-                edges_b = obj.get("ai_helper_loft_edges_b") or []
-                mesh = _loft_mesh_from_source(source, edges_a, edges_b, offset_z)
-            if mesh is None:
+            props = {key: obj[key] for key in obj.keys() if key.startswith("ai_helper_")}
+            op = props.get("ai_helper_op")
+            source_name = props.get("ai_helper_source")
+            if not op or not source_name:
                 continue
-            _replace_mesh(obj, mesh)
-            _apply_optional_modifiers(obj)
-            rebuilt += 1
-        elif op == "sweep":
-            profile_edges = obj.get("ai_helper_sweep_profile_edges") or []
-            path_edges = obj.get("ai_helper_sweep_path_edges") or []
-            twist_deg = float(obj.get("ai_helper_sweep_twist_deg", 0.0))
-            mesh = _sweep_mesh_from_source(source, profile_edges, path_edges, twist_deg=twist_deg)
-            if mesh is None:
+
+            source = objects.get(source_name)
+            if source is None:
+                continue
+
+            arrays = source_arrays.get(source_name)
+            if arrays is None:
+                arrays = source_arrays[source_name] = _source_arrays(source)
+            source_sig = source_sigs.get(source_name)
+            if source_sig is None:
+                source_sig = source_sigs[source_name] = _source_signature(source, arrays)
+            op_sig = _op_signature(source_sig, props)
+            if (
+                not force
+                and props.get(_SRC_SIG_KEY) == op_sig
+                and len(obj.data.vertices)
+                and (
+                    op != "revolve"
+                    # Revolves that still share a mesh with the sketch get their own copy back.
+                    or (obj.data.users == 1 and obj.modifiers.get("AI_Revolve") is not None)
+                )
+            ):
+                _apply_optional_modifiers(obj, props)
                 continue
-            _replace_mesh(obj, mesh)
-            _apply_optional_modifiers(obj)
-            rebuilt += 1
 
+            if op == "extrude":
+                distance = float(props.get("ai_helper_extrude_distance", 1.0))
+                edge_indices = props.get("ai_helper_extrude_edges")
+                if not source.data.polygons:
+                    edge_list = list(edge_indices) if edge_indices else None
+                    wire_jobs.append((obj, props, op_sig, *arrays, distance, edge_list))
+                    continue
+                mesh = _extrude_mesh_from_source(
+                    source, distance, edge_indices=edge_indices, source_bms=source_bms
+                )
+                if mesh is None:
+                    continue
+                _replace_mesh(obj, mesh)
+                _apply_optional_modifiers(obj, props)
+                obj[_SRC_SIG_KEY] = op_sig
+                rebuilt += 1
+            elif op == "revolve":
+                angle = math.radians(float(props.get("ai_helper_revolve_angle", 360.0)))
+                steps = int(props.get("ai_helper_revolve_steps", 32))
+                _replace_mesh(obj, _revolve_source_mesh(source, "AI_Revolve_mesh", arrays))
+                mod = obj.modifiers.get("AI_Revolve")
+                if mod is None:
+                    mod = obj.modifiers.new(name="AI_Revolve", type="SCREW")
+                    mod.axis = "Z"
+                    mod.use_merge_vertices = True
+                    mod.merge_threshold = 0.001
+                # Modifier writes re-tag the object, so only touch settings that changed.
+                if abs(mod.angle - angle) > 1e-6:
+                    mod.angle = angle
+                if mod.steps != steps:
+                    mod.steps = steps
+                _apply_optional_modifiers(obj, props)
+                obj[_SRC_SIG_KEY] = op_sig
+                rebuilt += 1
+            elif op == "loft":
+                sections = props.get("ai_helper_loft_sections")
+                offset_z = float(props.get("ai_helper_loft_offset_z", 0.0))
+                if isinstance(sections, list) and len(sections) >= 2:
+                    mesh = _loft_mesh_from_sections(source, sections, offset_z, arrays=arrays)
+                else:
+                    edges_a = props.get("ai_helper_loft_edges_a") or []
+                    edges_b = props.get("ai_helper_loft_edges_b") or []
+                    mesh = _loft_mesh_from_source(source, edges_a, edges_b, offset_z, arrays=arrays)
+                if mesh is None:
+                    continue
+                _replace_mesh(obj, mesh)
+                _apply_optional_modifiers(obj, props)
+                obj[_SRC_SIG_KEY] = op_sig
+                rebuilt += 1
+            elif op == "sweep":
+                profile_edges = props.get("ai_helper_sweep_profile_edges") or []
+                path_edges = props.get("ai_helper_sweep_path_edges") or []
+                twist_deg = float(props.get("ai_helper_sweep_twist_deg", 0.0))
+                mesh = _sweep_mesh_from_source(
+                    source, profile_edges, path_edges, twist_deg=twist_deg, arrays=arrays
+                )
+                if mesh is None:
+                    continue
+                _replace_mesh(obj, mesh)
+                _apply_optional_modifiers(obj, props)
+                obj[_SRC_SIG_KEY] = op_sig
+                rebuilt += 1
+
+        rebuilt += _finish_wire_extrudes(wire_jobs)
+    finally:
+        for bm in source_bms.values():
+            bm.free()
     return rebuilt
 
 
@@ -860,9 +1096,13 @@ def register():
     bpy.utils.register_class(AIHELPER_OT_clear_shell_modifier)
     bpy.utils.register_class(AIHELPER_OT_add_bevel_modifier)
     bpy.utils.register_class(AIHELPER_OT_clear_bevel_modifier)
+    if HAVE_JIT and not bpy.app.timers.is_registered(warm_kernels):
+        bpy.app.timers.register(warm_kernels, first_interval=1.0)
 
 
 def unregister():
+    if bpy.app.timers.is_registered(warm_kernels):
+        bpy.app.timers.unregister(warm_kernels)
     bpy.utils.unregister_class(AIHELPER_OT_clear_bevel_modifier)
     bpy.utils.unregister_class(AIHELPER_OT_add_bevel_modifier)
     bpy.utils.unregister_class(AIHELPER_OT_clear_shell_modifier)
@@ -16,7 +16,7 @@ from ..sketch.circles import (
     save_circles,
 )
 from ..sketch.dimensions import clear_dimensions, update_dimensions
-from ..sketch.history import snapshot_state
+from ..sketch.history import clear_history, snapshot_state
 from ..sketch.quadtree import Point2D, Quadtree
 from ..sketch.rectangles import (
     append_rectangle,
@@ -409,8 +409,7 @@ def clear_sketch_data(context) -> bool:
     clear_circles(obj)
     clear_rectangles(obj)
     clear_tags(obj)
-    if "ai_helper_history" in obj:
-        del obj["ai_helper_history"]
+    clear_history(obj)
     clear_dimensions(context)
     return True
 
@@ -1,9 +1,44 @@
+import json
+
 import bpy
 
+from .core.jsonio import json_dumps, json_loads
 from .llm.presets import preset_items
 from .llm.recipes import recipe_items
 
 
+_PAYLOAD_RAW = ""
+_PAYLOAD = {}
+
+
+def solver_payload(props):
+    global _PAYLOAD_RAW, _PAYLOAD
+    raw = props.last_solver_payload
+    if raw != _PAYLOAD_RAW:
+        try:
+            data = json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            data = {}
+        _PAYLOAD_RAW, _PAYLOAD = raw, data
+    return _PAYLOAD
+
+
+def _get_tool_calls_pretty(self):
+    raw = self.tool_calls_json.strip()
+    if not raw:
+        return ""
+    try:
+        return json_dumps(json_loads(raw), indent=True)
+    except (TypeError, ValueError):
+        return raw
+
+
+def _update_show_solver_report(_self, context):
+    from .ops import constraints
+
+    constraints.refresh_solver_report(context)
+
+
 class AIHelperProperties(bpy.types.PropertyGroup):
     prompt: bpy.props.StringProperty(
         name="Prompt",
@@ -40,23 +75,29 @@ class AIHelperProperties(bpy.types.PropertyGroup):
     )
     tool_calls_json: bpy.props.StringProperty(
         name="Tool Calls",
-        description="Preview of tool calls generated by the LLM",
+        description="Preview of tool calls generated by the LLM (compact JSON)",
         default="",
     )
-    last_solver_report: bpy.props.StringProperty(
-        name="Solver Report",
-        description="Last solver summary",
-        default="",
+    tool_calls_json_pretty: bpy.props.StringProperty(
+        name="Tool Calls (Formatted)",
+        description="Indented view of the tool call preview",
+        get=_get_tool_calls_pretty,
     )
-    last_solver_details: bpy.props.StringProperty(
-        name="Solver Details",
-        description="Top constraint errors",
+    last_solver_payload: bpy.props.StringProperty(
+        name="Solver Payload",
+        description="Last solver summary, top constraint errors and worst constraint id (JSON)",
         default="",
     )
-    last_solver_worst_id: bpy.props.StringProperty(
-        name="Solver Worst ID",
-        description="Constraint id with the largest error",
-        default="",
+    show_solver_report: bpy.props.BoolProperty(
+        name="Show Diagnostics",
+        description="Format and show solver diagnostics after each solve",
+        default=True,
+        update=_update_show_solver_report,
+    )
+    defer_solve: bpy.props.BoolProperty(
+        name="Defer Solve",
+        description="Coalesce solves after several constraint adds in a row",
+        default=False,
     )
     auto_rebuild: bpy.props.BoolProperty(
         name="Auto Rebuild 3D Ops",
@@ -219,6 +260,18 @@ class AIHelperProperties(bpy.types.PropertyGroup):
         default=0.0,
     )
 
+    @property
+    def last_solver_report(self):
+        return solver_payload(self).get("r", "")
+
+    @property
+    def last_solver_details(self):
+        return solver_payload(self).get("d", "")
+
+    @property
+    def last_solver_worst_id(self):
+        return solver_payload(self).get("w", "")
+
 
 def register():
     bpy.utils.register_class(AIHelperProperties)
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DistanceConstraint:
     id: str
     p1: str
@@ -22,7 +22,7 @@ class DistanceConstraint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AngleConstraint:
     id: str
     p1: str
@@ -42,7 +42,7 @@ class AngleConstraint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HorizontalConstraint:
     id: str
     line: str
@@ -52,7 +52,7 @@ class HorizontalConstraint:
         return {"id": self.id, "kind": self.kind, "line": self.line}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerticalConstraint:
     id: str
     line: str
@@ -62,7 +62,7 @@ class VerticalConstraint:
         return {"id": self.id, "kind": self.kind, "line": self.line}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParallelConstraint:
     id: str
     line_a: str
@@ -78,7 +78,7 @@ class ParallelConstraint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerpendicularConstraint:
     id: str
     line_a: str
@@ -94,7 +94,7 @@ class PerpendicularConstraint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoincidentConstraint:
     id: str
     p1: str
@@ -105,7 +105,7 @@ class CoincidentConstraint:
         return {"id": self.id, "kind": self.kind, "p1": self.p1, "p2": self.p2}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConcentricConstraint:
     id: str
     p1: str
@@ -116,7 +116,7 @@ class ConcentricConstraint:
         return {"id": self.id, "kind": self.kind, "p1": self.p1, "p2": self.p2}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SymmetryConstraint:
     id: str
     line: str
@@ -134,7 +134,7 @@ class SymmetryConstraint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TangentConstraint:
     id: str
     line: str
@@ -154,7 +154,7 @@ class TangentConstraint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MidpointConstraint:
     id: str
     line: str
@@ -165,7 +165,7 @@ class MidpointConstraint:
         return {"id": self.id, "kind": self.kind, "line": self.line, "point": self.point}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EqualLengthConstraint:
     id: str
     line_a: str
@@ -181,7 +181,7 @@ class EqualLengthConstraint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RadiusConstraint:
     id: str
     entity: str
@@ -192,7 +192,7 @@ class RadiusConstraint:
         return {"id": self.id, "kind": self.kind, "entity": self.entity, "radius": self.radius}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FixConstraint:
     id: str
     point: str
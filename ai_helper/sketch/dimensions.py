@@ -8,12 +8,15 @@ from .constraints import AngleConstraint, DistanceConstraint, RadiusConstraint
 _DIMENSION_KEY = "ai_helper_dimension_id"
 _DIMENSION_KIND_KEY = "ai_helper_dimension_kind"
 _DIMENSION_PREFIX = "AI_DIM_"
+_LABEL_SCALE = (0.2, 0.2, 0.2)
 
 
-def update_dimensions(context, sketch_obj, constraints):
+def update_dimensions(context, sketch_obj, constraints, changed_ids=None):
     mesh = sketch_obj.data
     collection = sketch_obj.users_collection[0] if sketch_obj.users_collection else context.collection
-    active_ids = {c.id for c in constraints if isinstance(c, (DistanceConstraint, AngleConstraint, RadiusConstraint))}
+    if changed_ids is not None:
+        # Value-only edits leave the label set and the geometry as they were.
+        constraints = [c for c in constraints if c.id in changed_ids]
     circles = load_circles(sketch_obj)
     circle_map = {circle.get("id"): circle for circle in circles}
 
@@ -26,12 +29,8 @@ def update_dimensions(context, sketch_obj, constraints):
                 continue
 
             text_obj = _ensure_label(constraint.id, constraint.kind, collection)
-            text_obj.data.body = f"{constraint.distance:.3f}"
-            text_obj.scale = (0.2, 0.2, 0.2)
-
             mid = (v1.co + v2.co) * 0.5
-            world = sketch_obj.matrix_world @ mid
-            text_obj.location = world
+            _apply_label(text_obj, f"{constraint.distance:.3f}", sketch_obj.matrix_world @ mid)
         elif isinstance(constraint, AngleConstraint):
             try:
                 p1 = mesh.vertices[int(constraint.p1)]
@@ -56,12 +55,8 @@ def update_dimensions(context, sketch_obj, constraints):
             offset = max(min(len1, len2) * 0.3, 0.2)
 
             text_obj = _ensure_label(constraint.id, constraint.kind, collection)
-            text_obj.data.body = f"{constraint.degrees:.2f} deg"
-            text_obj.scale = (0.2, 0.2, 0.2)
-
             pos = pv.co + bis * offset
-            world = sketch_obj.matrix_world @ pos
-            text_obj.location = world
+            _apply_label(text_obj, f"{constraint.degrees:.2f} deg", sketch_obj.matrix_world @ pos)
         elif isinstance(constraint, RadiusConstraint):
             circle = circle_map.get(constraint.entity)
             if not circle:
@@ -75,14 +70,12 @@ def update_dimensions(context, sketch_obj, constraints):
                 continue
 
             text_obj = _ensure_label(constraint.id, constraint.kind, collection)
-            text_obj.data.body = f"R {constraint.radius:.3f}"
-            text_obj.scale = (0.2, 0.2, 0.2)
-
             pos = center + Vector((constraint.radius, 0.0, 0.0))
-            world = sketch_obj.matrix_world @ pos
-            text_obj.location = world
+            _apply_label(text_obj, f"R {constraint.radius:.3f}", sketch_obj.matrix_world @ pos)
 
-    _remove_stale_dimensions(active_ids)
+    if changed_ids is None:
+        dimensioned = (DistanceConstraint, AngleConstraint, RadiusConstraint)
+        _remove_stale_dimensions({c.id for c in constraints if isinstance(c, dimensioned)})
 
 
 def clear_dimensions(context):
@@ -106,11 +99,24 @@ def _ensure_label(constraint_id, kind, collection):
         curve = bpy.data.curves.new(name=name, type="FONT")
         text_obj = bpy.data.objects.new(name, curve)
         collection.objects.link(text_obj)
-    text_obj[_DIMENSION_KEY] = constraint_id
-    text_obj[_DIMENSION_KIND_KEY] = kind
+    if text_obj.get(_DIMENSION_KEY) != constraint_id:
+        text_obj[_DIMENSION_KEY] = constraint_id
+    if text_obj.get(_DIMENSION_KIND_KEY) != kind:
+        text_obj[_DIMENSION_KIND_KEY] = kind
     return text_obj
 
 
+def _apply_label(text_obj, body, location):
+    # Only write what changed: a body write re-tags the font curve for a rebuild.
+    curve = text_obj.data
+    if curve.body != body:
+        curve.body = body
+    if any(abs(a - b) > 1e-6 for a, b in zip(text_obj.scale, _LABEL_SCALE)):
+        text_obj.scale = _LABEL_SCALE
+    if (text_obj.location - location).length_squared > 1e-12:
+        text_obj.location = location
+
+
 def _remove_stale_dimensions(active_ids):
     for obj in bpy.data.objects:
         cid = obj.get(_DIMENSION_KEY)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import List
+
+from ..core.jit import HAVE_JIT, jit
+
+# Ordered paths keyed by the raw bytes of the selected edge rows; the walk depends on nothing else.
+_PATH_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+_PATH_CACHE_SIZE = 256
+_PATH_CACHE_MAX_EDGES = 4096
+
+
+@jit
+def _link_edges(v1s, v2s, parent, first):
+    # Union each edge with the first edge seen at each endpoint; roots always move to the lower index.
+    for edge in range(len(v1s)):
+        for vert in (v1s[edge], v2s[edge]):
+            other = first[vert]
+            if other < 0:
+                first[vert] = edge
+                continue
+            a = edge
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            b = other
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a < b:
+                parent[b] = a
+            elif b < a:
+                parent[a] = b
+    # parent[i] <= i holds throughout, so one ascending pass resolves every root.
+    for edge in range(len(parent)):
+        parent[edge] = parent[parent[edge]]
+
+
+def edge_components(edge_ids, edge_rows) -> List[List[int]]:
+    import numpy as np
+
+    ids, index = np.unique(np.asarray(edge_ids, dtype=np.int64), return_index=True)
+    if not len(ids):
+        return []
+    rows = np.asarray(edge_rows, dtype=np.int64)[index]
+    vert_count = int(rows.max()) + 1
+    if HAVE_JIT:
+        parent = np.arange(len(ids), dtype=np.int64)
+        first = np.full(vert_count, -1, dtype=np.int64)
+        _link_edges(np.ascontiguousarray(rows[:, 0]), np.ascontiguousarray(rows[:, 1]), parent, first)
+        roots = parent
+    else:
+        parent = list(range(len(ids)))
+        _link_edges(rows[:, 0].tolist(), rows[:, 1].tolist(), parent, [-1] * vert_count)
+        roots = np.asarray(parent, dtype=np.int64)
+
+    order = np.argsort(roots, kind="stable")
+    _, starts = np.unique(roots[order], return_index=True)
+    return [group.tolist() for group in np.split(ids[order], starts[1:])]
+
+
+def warm_kernels() -> None:
+    # njit compiles on first call; do it up front rather than on the first loft or sweep.
+    if not HAVE_JIT:
+        return
+    import numpy as np
+
+    rows = np.array([[0, 1], [1, 2]], dtype=np.int64)
+    edge_components([0, 1], rows)
+    _ordered_path(rows)
+
+
+def vertex_degrees(edge_rows):
+    import numpy as np
+
+    counts = np.bincount(np.asarray(edge_rows, dtype=np.int64).ravel())
+    return counts[counts > 0]
+
+
+def is_closed_loop(edge_rows) -> bool:
+    # For one connected component, every vertex having degree 2 is exactly what makes it a single loop.
+    degrees = vertex_degrees(edge_rows)
+    return bool(len(degrees)) and bool((degrees == 2).all())
+
+
+def has_path_end(edge_rows) -> bool:
+    # ordered_path only returns an open path when it can start from a degree-1 vertex.
+    return bool((vertex_degrees(edge_rows) == 1).any())
+
+
+@jit
+def _walk_path(indptr, neighbors, start, closed, order, visited):
+    # Step to the smallest neighbour other than the one we came from, stopping on a revisit.
+    order[0] = start
+    visited[start] = 1
+    length = 1
+    prev = -1
+    curr = start
+    while True:
+        best = -1
+        for k in range(indptr[curr], indptr[curr + 1]):
+            vert = neighbors[k]
+            if vert != prev and (best < 0 or vert < best):
+                best = vert
+        if best < 0:
+            break
+        if closed and best == start:
+            break
+        if visited[best]:
+            break
+        order[length] = best
+        visited[best] = 1
+        length += 1
+        prev = curr
+        curr = best
+    return length
+
+
+def ordered_path(edge_rows):
+    import numpy as np
+
+    rows = np.asarray(edge_rows, dtype=np.int64).reshape(-1, 2)
+    if not len(rows):
+        return None, None
+    if len(rows) > _PATH_CACHE_MAX_EDGES:
+        return _ordered_path(rows)
+
+    key = rows.tobytes()
+    cached = _PATH_CACHE.get(key)
+    if cached is None:
+        cached = _PATH_CACHE[key] = _ordered_path(rows)
+        if len(_PATH_CACHE) > _PATH_CACHE_SIZE:
+            _PATH_CACHE.popitem(last=False)
+    else:
+        _PATH_CACHE.move_to_end(key)
+    order, closed = cached
+    return (list(order) if order is not None else None), closed
+
+
+def _ordered_path(rows):
+    import numpy as np
+
+    verts, compact = np.unique(rows, return_inverse=True)
+    compact = compact.reshape(-1, 2)
+    count = len(verts)
+    src = np.concatenate([compact[:, 0], compact[:, 1]])
+    dst = np.concatenate([compact[:, 1], compact[:, 0]])
+    neighbors = dst[np.argsort(src, kind="stable")]
+    indptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=count), out=indptr[1:])
+
+    degree = np.diff(indptr)
+    ends = np.flatnonzero(degree == 1)
+    closed = False
+    if len(ends):
+        start = int(ends[0])
+    else:
+        if np.any(degree != 2):
+            return None, None
+        closed = True
+        start = 0
+
+    if HAVE_JIT:
+        order = np.empty(count, dtype=np.int64)
+        length = _walk_path(indptr, neighbors, start, closed, order, np.zeros(count, dtype=np.int8))
+    else:
+        order = [0] * count
+        length = _walk_path(indptr.tolist(), neighbors.tolist(), start, closed, order, [0] * count)
+
+    if length != count:
+        return None, None
+    return verts[np.asarray(order[:length], dtype=np.int64)].tolist(), closed
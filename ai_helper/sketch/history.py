@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import copy
 import json
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import bpy
 import bmesh
@@ -15,24 +16,68 @@ from .tags import load_tags, save_tags
 
 
 _HISTORY_KEY = "ai_helper_history"
+_HISTORY_COUNT_KEY = "ai_helper_history_count"
 _MAX_HISTORY = 20
 
 
-def load_history(obj) -> List[Dict[str, object]]:
+# Parsed history keyed by object pointer: (raw json, entries).
+_CACHE: Dict[int, Tuple[str, List[Dict[str, object]]]] = {}
+
+
+def _parsed_history(obj) -> List[Dict[str, object]]:
     raw = obj.get(_HISTORY_KEY)
     if not raw:
         return []
+    key = obj.as_pointer()
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
     try:
         data = json.loads(raw)
     except json.JSONDecodeError:
         return []
     if not isinstance(data, list):
         return []
-    return [entry for entry in data if isinstance(entry, dict)]
+    history = [entry for entry in data if isinstance(entry, dict)]
+    _CACHE[key] = (raw, history)
+    return history
+
+
+def load_history(obj) -> List[Dict[str, object]]:
+    # The entries are shared with the parse cache; callers must only read them.
+    return list(_parsed_history(obj))
+
+
+def load_history_entry(obj, index: int) -> Optional[Dict[str, object]]:
+    history = _parsed_history(obj)
+    if index < 0 or index >= len(history):
+        return None
+    return copy.deepcopy(history[index])
+
+
+def history_count(obj) -> int:
+    count = obj.get(_HISTORY_COUNT_KEY)
+    if count is None:
+        return len(_parsed_history(obj))
+    return int(count)
+
+
+def clear_history(obj) -> None:
+    for key in (_HISTORY_KEY, _HISTORY_COUNT_KEY):
+        if key in obj:
+            del obj[key]
+    _CACHE.pop(obj.as_pointer(), None)
+
+
+def prune_cache(live_pointers) -> None:
+    for key in [key for key in _CACHE if key not in live_pointers]:
+        del _CACHE[key]
 
 
 def save_history(obj, history: List[Dict[str, object]]) -> None:
-    obj[_HISTORY_KEY] = json.dumps(history)
+    raw = json.dumps(history)
+    obj[_HISTORY_KEY] = raw
+    _CACHE[obj.as_pointer()] = (raw, list(history))
 
 
 def snapshot_state(obj, label: str) -> Dict[str, object]:
@@ -52,12 +97,14 @@ def snapshot_state(obj, label: str) -> Dict[str, object]:
         "tags": tags,
     }
 
+    count = history_count(obj) + 1
     history = load_history(obj)
     history.append(entry)
     if len(history) > _MAX_HISTORY:
         history = history[-_MAX_HISTORY:]
     save_history(obj, history)
-    return entry
+    obj[_HISTORY_COUNT_KEY] = count
+    return copy.deepcopy(entry)
 
 
 def restore_snapshot(obj, snapshot: Dict[str, object]) -> List[SketchConstraint]:
@@ -1,36 +1,108 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
 from ..solver import PointState, SolverDiagnostics, solve
-from .circles import load_circles
+from .circles import _CIRCLES_KEY, load_circles
 from .constraints import DistanceConstraint, RadiusConstraint, SketchConstraint
+from .store import _CONSTRAINTS_KEY
+
+
+# Shared "0", "1", ... keys so each solve does not re-stringify every index.
+_INDEX_KEYS: List[str] = []
+
+
+def _index_keys(count: int) -> List[str]:
+    if len(_INDEX_KEYS) < count:
+        _INDEX_KEYS.extend(str(idx) for idx in range(len(_INDEX_KEYS), count))
+    return _INDEX_KEYS
+
+
+_LAST_SOLVE_MOVED = True
+
+# Recent converged solves keyed by a digest of the stored constraint and circle json and input geometry.
+_SOLVE_CACHE: "OrderedDict[bytes, Tuple[bytes, SolverDiagnostics]]" = OrderedDict()
+_SOLVE_CACHE_SIZE = 32
+
+
+def _solve_key(obj, coords, edge_verts) -> bytes | None:
+    # Callers pass the constraints stored on obj, so their raw json stands in for them.
+    raw = obj.get(_CONSTRAINTS_KEY)
+    if not raw:
+        return None
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=16)
+    digest.update((obj.get(_CIRCLES_KEY) or "").encode("utf-8"))
+    digest.update(coords.tobytes())
+    digest.update(edge_verts.tobytes())
+    return digest.digest()
+
+
+def last_solve_moved() -> bool:
+    return _LAST_SOLVE_MOVED
 
 
 def solve_mesh(obj, constraints: list[SketchConstraint]) -> SolverDiagnostics:
+    global _LAST_SOLVE_MOVED
+    import numpy as np
+
     mesh = obj.data
-    points: Dict[str, PointState] = {}
-    line_map: Dict[str, Tuple[str, str]] = {}
+    vert_count = len(mesh.vertices)
+    edge_count = len(mesh.edges)
+    keys = _index_keys(max(vert_count, edge_count))
 
-    for idx, vert in enumerate(mesh.vertices):
-        points[str(idx)] = PointState(vert.co.x, vert.co.y)
+    coords = np.empty(vert_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
+    edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
 
-    for edge in mesh.edges:
-        line_map[str(edge.index)] = (str(edge.vertices[0]), str(edge.vertices[1]))
+    key = _solve_key(obj, coords, edge_verts)
+    cached = _SOLVE_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        _SOLVE_CACHE.move_to_end(key)
+        solved_raw, diag = cached
+        _LAST_SOLVE_MOVED = solved_raw != coords.tobytes()
+        if _LAST_SOLVE_MOVED:
+            mesh.vertices.foreach_set("co", np.frombuffer(solved_raw, dtype=np.float32))
+            mesh.update()
+        return diag
 
     expanded = _expand_radius_constraints(obj, constraints)
+    points: Dict[str, PointState] = {
+        keys[idx]: PointState(x, y) for idx, (x, y) in enumerate(coords[:, :2].tolist())
+    }
+    line_map: Dict[str, Tuple[str, str]] = {
+        keys[idx]: (keys[v1], keys[v2]) for idx, (v1, v2) in enumerate(edge_verts.reshape(-1, 2).tolist())
+    }
+
     diag = solve(points, expanded, line_map, max_iters=50, tolerance=1e-4)
 
-    for idx, vert in enumerate(mesh.vertices):
-        state = points.get(str(idx))
-        if state:
-            vert.co.x = state.x
-            vert.co.y = state.y
+    solved = [points[keys[idx]] for idx in range(vert_count)]
+    solved_xy = np.array([(state.x, state.y) for state in solved], dtype=np.float32).reshape(-1, 2)
+    # The mesh already holds the last solution, so an edit that it still satisfies moves nothing.
+    _LAST_SOLVE_MOVED = not np.array_equal(solved_xy, coords[:, :2])
+    if not _LAST_SOLVE_MOVED:
+        _remember_solve(key, coords, diag)
+        return diag
+    coords[:, :2] = solved_xy
+    _remember_solve(key, coords, diag)
+    mesh.vertices.foreach_set("co", coords.ravel())
 
     mesh.update()
     return diag
 
 
+def _remember_solve(key: bytes | None, coords, diag: SolverDiagnostics) -> None:
+    # The solver stops on a time budget, so only a converged result is the same on every replay.
+    if key is None or not diag.converged:
+        return
+    _SOLVE_CACHE[key] = (coords.tobytes(), diag)
+    if len(_SOLVE_CACHE) > _SOLVE_CACHE_SIZE:
+        _SOLVE_CACHE.popitem(last=False)
+
+
 def _expand_radius_constraints(obj, constraints: list[SketchConstraint]) -> list[SketchConstraint]:
     circles = load_circles(obj)
     circle_map = {circle.get("id"): circle for circle in circles}
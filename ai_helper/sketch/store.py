@@ -2,23 +2,50 @@ from __future__ import annotations
 
 import json
 import uuid
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from .constraints import SketchConstraint, constraint_from_dict, constraints_to_dict
 
 
 _CONSTRAINTS_KEY = "ai_helper_constraints"
+_VERSION_KEY = "ai_helper_constraints_version"
+
+# Parsed constraint lists keyed by object pointer: (version, raw json, constraints).
+_CACHE: Dict[int, Tuple[int, str, List[SketchConstraint]]] = {}
 
 
 def new_constraint_id() -> str:
     return uuid.uuid4().hex
 
 
+def _cache_key(obj) -> int:
+    as_pointer = getattr(obj, "as_pointer", None)
+    return as_pointer() if as_pointer is not None else id(obj)
+
+
+def prune_cache(live_pointers) -> None:
+    for key in [key for key in _CACHE if key not in live_pointers]:
+        del _CACHE[key]
+
+
+def _bump_version(obj) -> int:
+    version = int(obj.get(_VERSION_KEY, 0)) + 1
+    obj[_VERSION_KEY] = version
+    return version
+
+
 def load_constraints(obj) -> List[SketchConstraint]:
     raw = obj.get(_CONSTRAINTS_KEY)
     if not raw:
         return []
 
+    key = _cache_key(obj)
+    version = int(obj.get(_VERSION_KEY, 0))
+    cached = _CACHE.get(key)
+    # The raw comparison guards against undo or a reused pointer replaying an old version.
+    if cached is not None and cached[0] == version and cached[1] == raw:
+        return list(cached[2])
+
     try:
         data = json.loads(raw)
     except json.JSONDecodeError:
@@ -30,41 +57,62 @@ def load_constraints(obj) -> List[SketchConstraint]:
             constraints.append(constraint_from_dict(item))
         except ValueError:
             continue
-    return constraints
+    _CACHE[key] = (version, raw, constraints)
+    return list(constraints)
+
+
+def load_constraints_indexed(obj) -> Tuple[List[SketchConstraint], Dict[str, SketchConstraint]]:
+    constraints = load_constraints(obj)
+    return constraints, {getattr(c, "id", None): c for c in constraints}
 
 
 def save_constraints(obj, constraints: List[SketchConstraint]) -> None:
-    obj[_CONSTRAINTS_KEY] = json.dumps(constraints_to_dict(constraints))
+    raw = json.dumps(constraints_to_dict(constraints))
+    obj[_CONSTRAINTS_KEY] = raw
+    version = _bump_version(obj)
+    _CACHE[_cache_key(obj)] = (version, raw, list(constraints))
 
 
-def append_constraint(obj, constraint: SketchConstraint) -> None:
+def append_constraint(obj, constraint: SketchConstraint) -> List[SketchConstraint]:
     constraints = load_constraints(obj)
     constraints.append(constraint)
     save_constraints(obj, constraints)
+    return constraints
 
 
 def clear_constraints(obj) -> None:
     if _CONSTRAINTS_KEY in obj:
         del obj[_CONSTRAINTS_KEY]
+        _bump_version(obj)
+    _CACHE.pop(_cache_key(obj), None)
 
 
-def update_constraint(obj, constraint_id: str, updater) -> bool:
+def update_constraint(obj, constraint_id: str, updater) -> Optional[List[SketchConstraint]]:
     constraints = load_constraints(obj)
-    updated = False
     for idx, constraint in enumerate(constraints):
         if getattr(constraint, "id", None) == constraint_id:
             constraints[idx] = updater(constraint)
-            updated = True
-            break
-    if updated:
-        save_constraints(obj, constraints)
-    return updated
+            save_constraints(obj, constraints)
+            return constraints
+    return None
+
+
+def update_constraint_by_id(
+    obj, constraint_id: str, constraint: SketchConstraint
+) -> Optional[List[SketchConstraint]]:
+    constraints = load_constraints(obj)
+    for idx, existing in enumerate(constraints):
+        if getattr(existing, "id", None) == constraint_id:
+            constraints[idx] = constraint
+            save_constraints(obj, constraints)
+            return constraints
+    return None
 
 
-def remove_constraint(obj, constraint_id: str) -> bool:
+def remove_constraint(obj, constraint_id: str) -> Optional[List[SketchConstraint]]:
     constraints = load_constraints(obj)
     filtered = [c for c in constraints if getattr(c, "id", None) != constraint_id]
     if len(filtered) == len(constraints):
-        return False
+        return None
     save_constraints(obj, filtered)
-    return True
+    return filtered
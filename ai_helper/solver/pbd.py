@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import math
 import time
 from dataclasses import dataclass
@@ -67,11 +68,6 @@ def solve(
     constraints_list = list(constraints)
     snapshot = _snapshot_points(points)
     start = time.perf_counter()
-    max_error = 0.0
-    worst_id = None
-    worst_kind = None
-    unsupported: List[str] = []
-    iterations = 0
     dropped_constraints: List[str] = []
     fallback_applied = False
 
@@ -80,59 +76,17 @@ def solve(
         _relax_distances(points, constraints_list, pre_relax_iters, pre_relax_time_budget_ms)
     _apply_fix_constraints(points, constraints_list)
 
-    for iteration in range(max_iters):
-        max_error = 0.0
-        for constraint in constraints_list:
-            if isinstance(constraint, DistanceConstraint):
-                err = _apply_distance(points, constraint)
-            elif isinstance(constraint, CoincidentConstraint):
-                err = _apply_coincident(points, constraint)
-            elif isinstance(constraint, HorizontalConstraint):
-                err = _apply_horizontal(points, line_map, constraint)
-            elif isinstance(constraint, VerticalConstraint):
-                err = _apply_vertical(points, line_map, constraint)
-            elif isinstance(constraint, AngleConstraint):
-                err = _apply_angle(points, constraint)
-            elif isinstance(constraint, ParallelConstraint):
-                err = _apply_parallel(points, line_map, constraint)
-            elif isinstance(constraint, PerpendicularConstraint):
-                err = _apply_perpendicular(points, line_map, constraint)
-            elif isinstance(constraint, ConcentricConstraint):
-                err = _apply_concentric(points, constraint)
-            elif isinstance(constraint, SymmetryConstraint):
-                err = _apply_symmetry(points, line_map, constraint)
-            elif isinstance(constraint, TangentConstraint):
-                err = _apply_tangent(points, line_map, constraint)
-            elif isinstance(constraint, MidpointConstraint):
-                err = _apply_midpoint(points, line_map, constraint)
-            elif isinstance(constraint, EqualLengthConstraint):
-                err = _apply_equal_length(points, line_map, constraint)
-            elif isinstance(constraint, FixConstraint):
-                err = 0.0
-            else:
-                unsupported.append(type(constraint).__name__)
-                err = 0.0
-
-            abs_err = abs(err)
-            if abs_err > max_error:
-                max_error = abs_err
-                worst_id = getattr(constraint, "id", None)
-                worst_kind = type(constraint).__name__
-
-        iterations = iteration + 1
-        if max_error <= tolerance:
-            break
-
-        elapsed_ms = (time.perf_counter() - start) * 1000.0
-        if elapsed_ms >= time_budget_ms:
-            break
+    bound, unsupported = _bind_appliers(constraints_list)
+    iterations, max_error, worst_id, worst_kind = _iterate(
+        points, line_map, bound, max_iters, tolerance, time_budget_ms, start
+    )
 
     worst_constraints = _collect_errors(points, constraints_list, line_map, limit=5)
     diag = SolverDiagnostics(
         iterations=iterations,
         max_error=max_error,
         converged=max_error <= tolerance,
-        unsupported=sorted(set(unsupported)),
+        unsupported=unsupported,
         worst_constraint_id=worst_id,
         worst_constraint_kind=worst_kind,
         worst_constraints=worst_constraints,
@@ -163,51 +117,58 @@ def solve(
     filtered = [c for c in constraints_list if getattr(c, "id", None) not in drop_ids]
 
     fallback_applied = True
-    max_error = 0.0
-    worst_id = None
-    worst_kind = None
-    unsupported = []
-    iterations = 0
     start = time.perf_counter()
 
+    bound, unsupported = _bind_appliers(filtered)
+    iterations, max_error, worst_id, worst_kind = _iterate(
+        points, line_map, bound, max_iters, tolerance, time_budget_ms, start
+    )
+
+    worst_constraints = _collect_errors(points, filtered, line_map, limit=5)
+    return SolverDiagnostics(
+        iterations=iterations,
+        max_error=max_error,
+        converged=max_error <= tolerance,
+        unsupported=unsupported,
+        worst_constraint_id=worst_id,
+        worst_constraint_kind=worst_kind,
+        worst_constraints=worst_constraints,
+        fallback_applied=fallback_applied,
+        dropped_constraints=drop_ids,
+    )
+
+
+def _bind_appliers(constraints: List[SketchConstraint]):
+    bound = []
+    unsupported = set()
+    for constraint in constraints:
+        apply = _APPLIERS.get(type(constraint))
+        if apply is not None:
+            bound.append((constraint, apply))
+        elif not isinstance(constraint, FixConstraint):
+            unsupported.add(type(constraint).__name__)
+    return bound, sorted(unsupported)
+
+
+def _iterate(
+    points: Dict[str, PointState],
+    line_map: Dict[str, Tuple[str, str]],
+    bound,
+    max_iters: int,
+    tolerance: float,
+    time_budget_ms: float,
+    start: float,
+):
+    iterations = 0
+    max_error = 0.0
+    worst = None
     for iteration in range(max_iters):
         max_error = 0.0
-        for constraint in filtered:
-            if isinstance(constraint, DistanceConstraint):
-                err = _apply_distance(points, constraint)
-            elif isinstance(constraint, CoincidentConstraint):
-                err = _apply_coincident(points, constraint)
-            elif isinstance(constraint, HorizontalConstraint):
-                err = _apply_horizontal(points, line_map, constraint)
-            elif isinstance(constraint, VerticalConstraint):
-                err = _apply_vertical(points, line_map, constraint)
-            elif isinstance(constraint, AngleConstraint):
-                err = _apply_angle(points, constraint)
-            elif isinstance(constraint, ParallelConstraint):
-                err = _apply_parallel(points, line_map, constraint)
-            elif isinstance(constraint, PerpendicularConstraint):
-                err = _apply_perpendicular(points, line_map, constraint)
-            elif isinstance(constraint, ConcentricConstraint):
-                err = _apply_concentric(points, constraint)
-            elif isinstance(constraint, SymmetryConstraint):
-                err = _apply_symmetry(points, line_map, constraint)
-            elif isinstance(constraint, TangentConstraint):
-                err = _apply_tangent(points, line_map, constraint)
-            elif isinstance(constraint, MidpointConstraint):
-                err = _apply_midpoint(points, line_map, constraint)
-            elif isinstance(constraint, EqualLengthConstraint):
-                err = _apply_equal_length(points, line_map, constraint)
-            elif isinstance(constraint, FixConstraint):
-                err = 0.0
-            else:
-                unsupported.append(type(constraint).__name__)
-                err = 0.0
-
-            abs_err = abs(err)
+        for constraint, apply in bound:
+            abs_err = abs(apply(points, line_map, constraint))
             if abs_err > max_error:
                 max_error = abs_err
-                worst_id = getattr(constraint, "id", None)
-                worst_kind = type(constraint).__name__
+                worst = constraint
 
         iterations = iteration + 1
         if max_error <= tolerance:
@@ -217,18 +178,9 @@ def solve(
         if elapsed_ms >= time_budget_ms:
             break
 
-    worst_constraints = _collect_errors(points, filtered, line_map, limit=5)
-    return SolverDiagnostics(
-        iterations=iterations,
-        max_error=max_error,
-        converged=max_error <= tolerance,
-        unsupported=sorted(set(unsupported)),
-        worst_constraint_id=worst_id,
-        worst_constraint_kind=worst_kind,
-        worst_constraints=worst_constraints,
-        fallback_applied=fallback_applied,
-        dropped_constraints=drop_ids,
-    )
+    if worst is None:
+        return iterations, max_error, None, None
+    return iterations, max_error, getattr(worst, "id", None), type(worst).__name__
 
 
 def _apply_distance(points: Dict[str, PointState], c: DistanceConstraint) -> float:
@@ -429,8 +381,7 @@ def _collect_errors(
         kind = getattr(constraint, "kind", type(constraint).__name__)
         errors.append(ConstraintError(getattr(constraint, "id", None), str(kind), error))
 
-    errors.sort(key=lambda e: abs(e.error), reverse=True)
-    return errors[:limit]
+    return heapq.nlargest(limit, errors, key=lambda e: abs(e.error))
 
 
 def _constraint_error(
@@ -989,3 +940,20 @@ def _equal_length_error(
     len_a = math.hypot(a2.x - a1.x, a2.y - a1.y)
     len_b = math.hypot(b2.x - b1.x, b2.y - b1.y)
     return len_a - len_b
+
+
+# Per-type step functions, resolved once per solve instead of per constraint visit.
+_APPLIERS = {
+    DistanceConstraint: lambda points, line_map, c: _apply_distance(points, c),
+    CoincidentConstraint: lambda points, line_map, c: _apply_coincident(points, c),
+    HorizontalConstraint: _apply_horizontal,
+    VerticalConstraint: _apply_vertical,
+    AngleConstraint: lambda points, line_map, c: _apply_angle(points, c),
+    ParallelConstraint: _apply_parallel,
+    PerpendicularConstraint: _apply_perpendicular,
+    ConcentricConstraint: lambda points, line_map, c: _apply_concentric(points, c),
+    SymmetryConstraint: _apply_symmetry,
+    TangentConstraint: _apply_tangent,
+    MidpointConstraint: _apply_midpoint,
+    EqualLengthConstraint: _apply_equal_length,
+}
@@ -275,6 +275,7 @@ class AIHELPER_PT_constraints(bpy.types.Panel):
         layout.operator("aihelper.add_perpendicular_constraint", text="Add Perpendicular")
         layout.operator("aihelper.add_fix_constraint", text="Add Fix")
         layout.separator()
+        layout.prop(props, "defer_solve")
         layout.operator("aihelper.solve_constraints", text="Solve")
         layout.operator("aihelper.clear_constraints", text="Clear")
         layout.separator()
@@ -300,14 +301,16 @@ class AIHELPER_PT_constraints(bpy.types.Panel):
                     op.constraint_id = constraint.id
                 op = row.operator("aihelper.remove_constraint", text="X")
                 op.constraint_id = constraint.id
-        if props.last_solver_report:
+        layout.prop(props, "show_solver_report")
+        show_report = props.show_solver_report
+        if show_report and props.last_solver_report:
             layout.label(text=props.last_solver_report)
         if props.last_solver_worst_id:
             layout.operator("aihelper.select_worst_constraint", text="Select Worst")
-        if props.last_solver_details:
+        if show_report and props.last_solver_details:
             for line in props.last_solver_details.splitlines():
                 layout.label(text=line)
-        if props.last_solver_report or props.last_solver_details:
+        if show_report and (props.last_solver_report or props.last_solver_details):
             layout.operator("aihelper.clear_solver_report", text="Clear Diagnostics")
 
 